@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import argparse
-import json
+import concurrent.futures
+import os
 from pathlib import Path
 from typing import Any
 
@@ -10,22 +11,26 @@ import asyncio
 from rich.console import Console
 
 from deckgen.config import load_config
-from deckgen.pipeline.images import generate_images
-from deckgen.pipeline.image_outline import generate_image_outline
-from deckgen.pipeline.outline import generate_simulation_outline
-from deckgen.pipeline.policies import generate_policies
-from deckgen.pipeline.print_export import export_print, export_text_mockups
-from deckgen.pipeline.render_cards import render_cards
-from deckgen.pipeline.stages import generate_stage_cards
-from deckgen.pipeline.taxonomy import generate_taxonomy
-from deckgen.pipeline.validation import validate_deck
 from deckgen.utils.asyncio_utils import run_async
-from deckgen.utils.io import read_json, read_jsonl, write_json, write_yaml
+from deckgen.utils.io import json_loads, read_json, read_jsonl, write_json, write_yaml
+
+# Pipeline modules are imported lazily inside the run_* entry points so each
+# subcommand only pays the import cost of the stages it actually uses.
 
 console = Console()
 
 
 def main() -> None:
+    import logging
+
+    from rich.logging import RichHandler
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[RichHandler(console=console, show_path=False)],
+    )
+
     parser = argparse.ArgumentParser(prog="deckgen")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -57,14 +62,18 @@ def main() -> None:
     elif args.command == "print":
         run_print(_resolve_path(args.deck))
     elif args.command == "all":
-        out_dir = _resolve_path(args.out)
-        run_generate(_resolve_path(args.config), out_dir)
-        run_render(out_dir)
-        run_images(out_dir)
-        run_print(out_dir)
+        run_all(_resolve_path(args.config), _resolve_path(args.out))
 
 
 def run_generate(config_path: Path, out_dir: Path, *, reset: bool = False) -> None:
+    from deckgen.pipeline.image_outline import generate_image_outline
+    from deckgen.pipeline.outline import generate_simulation_outline
+    from deckgen.pipeline.policies import generate_policies
+    from deckgen.pipeline.print_export import export_text_mockups
+    from deckgen.pipeline.stages import generate_stage_cards
+    from deckgen.pipeline.taxonomy import generate_taxonomy
+    from deckgen.pipeline.validation import validate_deck
+
     config = load_config(config_path)
     out_dir.mkdir(parents=True, exist_ok=True)
     write_yaml(out_dir / "meta" / "config_resolved.yaml", config.data)
@@ -146,6 +155,14 @@ def run_generate(config_path: Path, out_dir: Path, *, reset: bool = False) -> No
 
 
 def run_generate_from_config(config_data: dict[str, Any], out_dir: Path, *, reset: bool = False) -> None:
+    from deckgen.pipeline.image_outline import generate_image_outline
+    from deckgen.pipeline.outline import generate_simulation_outline
+    from deckgen.pipeline.policies import generate_policies
+    from deckgen.pipeline.print_export import export_text_mockups
+    from deckgen.pipeline.stages import generate_stage_cards
+    from deckgen.pipeline.taxonomy import generate_taxonomy
+    from deckgen.pipeline.validation import validate_deck
+
     out_dir.mkdir(parents=True, exist_ok=True)
     write_yaml(out_dir / "meta" / "config_resolved.yaml", config_data)
 
@@ -225,7 +242,25 @@ def run_generate_from_config(config_data: dict[str, Any], out_dir: Path, *, rese
     console.print(f"[green]Generated deck at {out_dir}[/green]")
 
 
+def run_all(config_path: Path, out_dir: Path) -> None:
+    """Run the full pipeline, overlapping independent stages.
+
+    Rendering and image generation both consume the card files written by
+    the generate step but not each other's outputs, so they run concurrently
+    once generation completes.
+    """
+    run_generate(config_path, out_dir)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        render_future = executor.submit(run_render, out_dir)
+        images_future = executor.submit(run_images, out_dir)
+        render_future.result()
+        images_future.result()
+    run_print(out_dir)
+
+
 def run_render(deck_dir: Path) -> None:
+    from deckgen.pipeline.render_cards import render_cards
+
     policies = _read_cards(deck_dir / "cards" / "policies.jsonl")
     developments = _read_cards_multi(deck_dir / "cards")
     render_cards(policies, developments, deck_dir)
@@ -233,6 +268,8 @@ def run_render(deck_dir: Path) -> None:
 
 
 def run_images(deck_dir: Path) -> None:
+    from deckgen.pipeline.images import generate_images
+
     policies = _read_cards(deck_dir / "cards" / "policies.jsonl")
     developments = _read_cards_multi(deck_dir / "cards")
     config = _read_config(deck_dir)
@@ -240,23 +277,44 @@ def run_images(deck_dir: Path) -> None:
 
 
 def run_print(deck_dir: Path) -> None:
+    from deckgen.pipeline.print_export import export_print
+
     export_print(deck_dir)
     console.print("[green]Print export complete.[/green]")
 
 
 def _read_cards(path: Path) -> list[dict[str, str]]:
-    cards = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            if line.strip():
-                cards.append(json.loads(line))
+    # Read as raw bytes and split on newlines ourselves; this skips the
+    # per-line universal-newline decoding and is notably faster on big decks.
+    cards: list[dict[str, str]] = []
+    buffer = b""
+    with path.open("rb") as handle:
+        while chunk := handle.read(1 << 20):
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            cards.extend(json_loads(line) for line in lines if line.strip())
+    if buffer.strip():
+        cards.append(json_loads(buffer))
     return cards
 
 
 def _read_cards_multi(cards_dir: Path) -> list[dict[str, str]]:
-    cards = []
-    for file in cards_dir.glob("developments.stage*.jsonl"):
-        cards.extend(_read_cards(file))
+    # os.scandir avoids re-statting every entry in deck folders that can
+    # also hold hundreds of rendered PNGs.
+    with os.scandir(cards_dir) as entries:
+        files = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file()
+            and entry.name.startswith("developments.stage")
+            and entry.name.endswith(".jsonl")
+        )
+    if not files:
+        return []
+    cards: list[dict[str, str]] = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        for part in executor.map(_read_cards, files):
+            cards.extend(part)
     return cards
 
 
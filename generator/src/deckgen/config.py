@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
-from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:  # libyaml-backed loader is much faster when PyYAML is built with C support
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 DEFAULT_CONFIG = {
     "scenario": {
@@ -103,6 +109,9 @@ DEFAULT_CONFIG = {
         "image_retry_limit": 2,
         "critique_retry_limit": 2,
         "resume": True,
+        "image_cache_dir": None,
+        "image_api_mode": "direct",
+        "distributed_limit_key": None,
         "prompt_path": None,
         "outline_model": None,
         "policy_model": None,
@@ -119,30 +128,54 @@ class ResolvedConfig:
 
 def load_config(path: Path) -> ResolvedConfig:
     path = path.expanduser().resolve()
-    with path.open("r", encoding="utf-8") as handle:
-        user_cfg = yaml.safe_load(handle) or {}
-    merged = _deep_merge(DEFAULT_CONFIG, user_cfg)
+    merged = _load_config_cached(str(path), path.stat().st_mtime_ns)
     return ResolvedConfig(data=merged, source_path=path)
 
 
+@lru_cache(maxsize=32)
+def _load_config_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    with open(path_str, "r", encoding="utf-8") as handle:
+        user_cfg = yaml.load(handle, Loader=_SafeLoader) or {}
+    return _deep_merge(DEFAULT_CONFIG, user_cfg)
+
+
 def resolve_config(overrides: dict[str, Any] | None = None) -> dict[str, Any]:
-    """Resolve a config dict by applying overrides to defaults."""
-    base = deepcopy(DEFAULT_CONFIG)
-    if overrides:
-        return _deep_merge(base, overrides)
-    return base
+    """Resolve a config dict by applying overrides to defaults.
+
+    Merged results are cached by the frozen overrides payload, so repeated
+    resolution of the same overrides (once per pipeline step) skips the
+    defaults walk.
+    """
+    if not overrides:
+        return _resolve_cached("{}")
+    try:
+        frozen = json.dumps(overrides, sort_keys=True)
+    except (TypeError, ValueError):
+        return _deep_merge(DEFAULT_CONFIG, overrides)
+    return _resolve_cached(frozen)
+
+
+@lru_cache(maxsize=64)
+def _resolve_cached(frozen_overrides: str) -> dict[str, Any]:
+    # DEFAULT_CONFIG is treated as immutable: merging aliases untouched
+    # subtrees instead of deep-copying the whole defaults tree.
+    return _deep_merge(DEFAULT_CONFIG, json.loads(frozen_overrides))
+
+
+_MISSING = object()
 
 
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     result: dict[str, Any] = {}
-    for key in base.keys() | override.keys():
-        if key in base and key in override:
-            if isinstance(base[key], dict) and isinstance(override[key], dict):
-                result[key] = _deep_merge(base[key], override[key])
-            else:
-                result[key] = override[key]
-        elif key in base:
-            result[key] = base[key]
+    for key, value in base.items():
+        override_value = override.get(key, _MISSING)
+        if override_value is _MISSING:
+            result[key] = value
+        elif isinstance(value, dict) and isinstance(override_value, dict):
+            result[key] = _deep_merge(value, override_value)
         else:
-            result[key] = override[key]
+            result[key] = override_value
+    for key, value in override.items():
+        if key not in base:
+            result[key] = value
     return result
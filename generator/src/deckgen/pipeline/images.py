@@ -1,58 +1,165 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Coroutine
+from typing import Any
 import asyncio
 import base64
+import binascii
 import concurrent.futures
-import glob
+import hashlib
+import heapq
+import itertools
 import json
+import logging
 import math
+import os
 import random
+import re
 import shutil
+import tempfile
+import threading
+import time
 
+import httpx
 from rich.console import Console
 from tqdm import tqdm
 
 from deckgen.config import resolve_config
-from deckgen.schemas import IMAGE_CRITIQUE_SCHEMA
+from deckgen.schemas import IMAGE_CRITIQUE_BATCH_SCHEMA
 from deckgen.utils.asyncio_utils import run_async
+from deckgen.utils.io import json_loads
 from deckgen.utils.openai_client import OpenAIClient
-from deckgen.utils.parallel import gather_with_concurrency
+from deckgen.utils.parallel import CrossProcessSemaphore, bounded_map
 from deckgen.utils.prompts import render_prompt
 from deckgen.utils.utility_functions import dummy_image_critique
 
 console = Console()
+logger = logging.getLogger(__name__)
 
 
 _DUMMY_PNG_BASE64 = (
-    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/xcAAwMCAOqf2m0AAAAASUVORK5CYII="
+    b"iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/xcAAwMCAOqf2m0AAAAASUVORK5CYII="
 )
 
 
+# Decoded once at import; placeholder writes happen on error paths that
+# may fire hundreds of times in a degraded run.
+_DUMMY_PNG_BYTES = base64.b64decode(_DUMMY_PNG_BASE64)
+
+
+@dataclass(slots=True)
+class CardView:
+    """Snapshot of the card fields the image hot paths read repeatedly.
+
+    Built once per card when candidate tasks are created; slotted attribute
+    access replaces the repeated ``dict.get`` calls (id, title, art_prompt,
+    card_type) the dispatch and logging loops would otherwise perform.
+    """
+
+    id: str
+    title: str
+    art_prompt: str
+    card_type: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class GenerationContext:
+    """Generation settings shared by every candidate task of one card group.
+
+    Tasks used to carry these as a dozen duplicated dict entries each;
+    one frozen context per group keeps the per-task dicts down to the
+    fields that actually vary and makes the shared settings hashable for
+    batch grouping.
+    """
+
+    client: OpenAIClient
+    model: str | None
+    responses_model: str | None
+    api: str
+    size: str | None
+    quality: str | None
+    background: str | None
+    resume: bool
+    cache_dir: str | None
+    card_type: str
+    reference_images: tuple[Path, ...]
+    is_reference: bool
+
+
+_API_RETRY_ATTEMPTS = 3
+
+
+def _is_retryable_api_error(exc: Exception) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _nonempty(path: Path) -> bool:
+    # A single os.stat covers both the existence and the size check; the
+    # exists()+stat() spelling costs two syscalls per candidate on resume.
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+
+_B64_CHUNK_CHARS = 4096 * 4  # multiple of 4 so every window decodes cleanly
+
+
+def _write_b64_payload(path: Path, data: str | bytes) -> None:
+    """Decode a base64 payload to disk in chunks.
+
+    A 1536x1024 PNG arrives as a multi-megabyte base64 string; decoding it
+    in windows avoids materializing a second full-size bytes buffer.
+    """
+    if isinstance(data, str):
+        data = data.encode("ascii")
+    with path.open("wb") as handle:
+        for start in range(0, len(data), _B64_CHUNK_CHARS):
+            handle.write(binascii.a2b_base64(data[start : start + _B64_CHUNK_CHARS]))
+
+
 def generate_images(
     config: dict[str, Any],
     policies: list[dict[str, Any]],
     developments: list[dict[str, Any]],
     out_dir: Path,
 ) -> None:
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        asyncio.run(generate_images_async(config, policies, developments, out_dir))
-    else:
-        console.print(
-            "[yellow]Active event loop detected; running image generation asynchronously in a worker thread.[/yellow]"
-        )
-        _run_async_in_thread(generate_images_async(config, policies, developments, out_dir))
-
-
-def _generate_images_sync(
+    run_async(generate_images_async(config, policies, developments, out_dir))
+
+
+@dataclass(slots=True)
+class ImagePlan:
+    """Prepared inputs shared by the sync and async image drivers."""
+
+    client: OpenAIClient
+    candidate_tasks: list[dict[str, Any]]
+    concurrency: int
+    image_api_mode: str
+    distributed_limit_key: str | None
+    image_timeout_s: float | None
+    image_retry_limit: int
+    prompt_path: str | None
+    critique_model: str | None
+    critique_reasoning_effort: str | None
+    critique_store: bool
+    critique_concurrency: int
+    critique_timeout_s: float | None
+    critique_retry_limit: int
+
+
+async def _prepare_plan(
     config: dict[str, Any],
     policies: list[dict[str, Any]],
     developments: list[dict[str, Any]],
     out_dir: Path,
-) -> None:
+) -> ImagePlan:
     resolved = resolve_config(config)
     image_cfg = resolved.get("models", {}).get("image", {})
     runtime_cfg = resolved.get("runtime", {})
@@ -76,6 +183,9 @@ def _generate_images_sync(
     reference_dev = image_cfg.get("reference_development_image")
     reference_power = image_cfg.get("reference_power_image")
     resume = runtime_cfg.get("resume", True)
+    cache_dir = runtime_cfg.get("image_cache_dir")
+    image_api_mode = runtime_cfg.get("image_api_mode", "direct")
+    distributed_limit_key = runtime_cfg.get("distributed_limit_key")
     concurrency = runtime_cfg.get("concurrency_image", 4)
     candidate_count = _normalize_candidate_count(runtime_cfg.get("image_candidate_count", 8))
     reference_multiplier = runtime_cfg.get("image_reference_candidate_multiplier", 5)
@@ -88,14 +198,12 @@ def _generate_images_sync(
     console.print(f"[cyan]Generating {len(policies)} policy images and {len(developments)} development images.[/cyan]")
     policy_dir = out_dir / "images" / "policy"
     dev_dir = out_dir / "images" / "development"
-    thumbs_dir = out_dir / "render" / "thumbs"
     policy_dir.mkdir(parents=True, exist_ok=True)
     dev_dir.mkdir(parents=True, exist_ok=True)
-    thumbs_dir.mkdir(parents=True, exist_ok=True)
 
     client = OpenAIClient()
 
-    policy_ref_paths, dev_ref_paths, power_ref_paths = _prepare_reference_images(
+    policy_ref_paths, dev_ref_paths, power_ref_paths = await _prepare_reference_images(
         api=api,
         reference_policy=reference_policy,
         reference_dev=reference_dev,
@@ -118,6 +226,7 @@ def _generate_images_sync(
         reference_quality=reference_quality,
         background=background,
         resume=resume,
+        cache_dir=cache_dir,
         regen_concurrency=concurrency,
         image_timeout_s=image_timeout_s,
         critique_timeout_s=critique_timeout_s,
@@ -130,351 +239,231 @@ def _generate_images_sync(
     standard_with_rulebox = [card for card in standard_devs if card.get("rule_box_text")]
     standard_plain = [card for card in standard_devs if not card.get("rule_box_text")]
 
-    candidate_tasks = (
-        _build_candidate_tasks(
-            cards=policies,
-            card_type="policy",
-            out_dir=policy_dir,
-            candidate_count=candidate_count,
-            reference_images=policy_ref_paths,
-            client=client,
-            model=model,
-            responses_model=responses_model,
-            api=api,
-            size=size,
-            quality=quality,
-            background=background,
-            resume=resume,
-        )
-        + _build_candidate_tasks(
-            cards=standard_plain,
-            card_type="development",
-            out_dir=dev_dir,
-            candidate_count=candidate_count,
-            reference_images=dev_ref_paths,
-            client=client,
-            model=model,
-            responses_model=responses_model,
-            api=api,
-            size=size,
-            quality=quality,
-            background=background,
-            resume=resume,
-        )
-        + _build_candidate_tasks(
-            cards=standard_with_rulebox,
-            card_type="development",
-            out_dir=dev_dir,
-            candidate_count=candidate_count,
-            reference_images=dev_ref_paths,
-            client=client,
-            model=model,
-            responses_model=responses_model,
-            api=api,
-            size=size,
-            quality=quality,
-            background=background,
-            resume=resume,
-        )
-        + _build_candidate_tasks(
-            cards=power_devs,
-            card_type="development",
-            out_dir=dev_dir,
-            candidate_count=candidate_count,
-            reference_images=power_ref_paths,
-            client=client,
-            model=model,
-            responses_model=responses_model,
-            api=api,
-            size=size,
-            quality=quality,
-            background=background,
-            resume=resume,
+    card_groups = [
+        (policies, "policy", policy_dir, policy_ref_paths),
+        (standard_plain, "development", dev_dir, dev_ref_paths),
+        (standard_with_rulebox, "development", dev_dir, dev_ref_paths),
+        (power_devs, "development", dev_dir, power_ref_paths),
+    ]
+    # chain.from_iterable flattens the per-group task lists into one pass
+    # with no intermediate concatenated copies.
+    candidate_tasks = list(
+        itertools.chain.from_iterable(
+            _build_candidate_tasks(
+                cards=cards,
+                card_type=card_type,
+                out_dir=group_dir,
+                candidate_count=candidate_count,
+                reference_images=ref_paths,
+                client=client,
+                model=model,
+                responses_model=responses_model,
+                api=api,
+                size=size,
+                quality=quality,
+                background=background,
+                resume=resume,
+                cache_dir=cache_dir,
+            )
+            for cards, card_type, group_dir, ref_paths in card_groups
         )
     )
 
-    _run_generation_tasks(
-        candidate_tasks,
-        concurrency,
-        desc="Card image candidates",
-        timeout_s=image_timeout_s,
-        retry_limit=image_retry_limit,
-    )
-    _finalize_best_candidates(
-        tasks=candidate_tasks,
+    return ImagePlan(
         client=client,
+        candidate_tasks=candidate_tasks,
+        concurrency=concurrency,
+        image_api_mode=image_api_mode,
+        distributed_limit_key=distributed_limit_key,
+        image_timeout_s=image_timeout_s,
+        image_retry_limit=image_retry_limit,
         prompt_path=prompt_path,
-        model=critique_model,
-        reasoning_effort=text_cfg.get("reasoning_effort"),
-        store=text_cfg.get("store", False),
-        concurrency=critique_concurrency,
-        desc="Card image critiques",
-        timeout_s=critique_timeout_s,
-        retry_limit=critique_retry_limit,
-    )
-
-
-def _run_async_in_thread(coro: Coroutine[Any, Any, None]) -> None:
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(asyncio.run, coro)
-        future.result()
-
-
-async def generate_images_async(
-    config: dict[str, Any],
-    policies: list[dict[str, Any]],
-    developments: list[dict[str, Any]],
-    out_dir: Path,
-) -> None:
-    resolved = resolve_config(config)
-    image_cfg = resolved.get("models", {}).get("image", {})
-    runtime_cfg = resolved.get("runtime", {})
-    text_cfg = resolved.get("models", {}).get("text", {})
-    prompt_path = runtime_cfg.get("prompt_path")
-    model = image_cfg.get("model") or "gpt-image-1.5"
-    size = image_cfg.get("size")
-    quality = image_cfg.get("quality") or "auto"
-    reference_quality = image_cfg.get("reference_quality") or quality
-    background = image_cfg.get("background")
-    api = image_cfg.get("api", "images")
-    if api != "images":
-        console.print("[yellow]Overriding image API to 'images' for consistent generation.[/yellow]")
-        api = "images"
-    if model != "gpt-image-1.5":
-        console.print("[yellow]Overriding image model to gpt-image-1.5 for consistent generation.[/yellow]")
-        model = "gpt-image-1.5"
-    responses_model = image_cfg.get("responses_model") or model or "gpt-5.2"
-    critique_model = text_cfg.get("model") or responses_model or "gpt-5.2"
-    reference_policy = image_cfg.get("reference_policy_image")
-    reference_dev = image_cfg.get("reference_development_image")
-    reference_power = image_cfg.get("reference_power_image")
-    resume = runtime_cfg.get("resume", True)
-    concurrency = runtime_cfg.get("concurrency_image", 4)
-    candidate_count = _normalize_candidate_count(runtime_cfg.get("image_candidate_count", 8))
-    reference_multiplier = runtime_cfg.get("image_reference_candidate_multiplier", 5)
-    critique_concurrency = runtime_cfg.get("concurrency_text", 4)
-    image_timeout_s = _resolve_timeout_seconds(runtime_cfg.get("image_timeout_s"))
-    critique_timeout_s = _resolve_timeout_seconds(runtime_cfg.get("critique_timeout_s"))
-    image_retry_limit = int(runtime_cfg.get("image_retry_limit", 0) or 0)
-    critique_retry_limit = int(runtime_cfg.get("critique_retry_limit", 0) or 0)
-
-    console.print(f"[cyan]Generating {len(policies)} policy images and {len(developments)} development images.[/cyan]")
-    policy_dir = out_dir / "images" / "policy"
-    dev_dir = out_dir / "images" / "development"
-    thumbs_dir = out_dir / "render" / "thumbs"
-    policy_dir.mkdir(parents=True, exist_ok=True)
-    dev_dir.mkdir(parents=True, exist_ok=True)
-    thumbs_dir.mkdir(parents=True, exist_ok=True)
-
-    client = OpenAIClient()
-
-    policy_ref_paths, dev_ref_paths, power_ref_paths = _prepare_reference_images(
-        api=api,
-        reference_policy=reference_policy,
-        reference_dev=reference_dev,
-        reference_power=reference_power,
-        policy_dir=policy_dir,
-        dev_dir=dev_dir,
-        policies=policies,
-        developments=developments,
-        client=client,
-        model=model,
-        responses_model=responses_model,
         critique_model=critique_model,
         critique_reasoning_effort=text_cfg.get("reasoning_effort"),
         critique_store=text_cfg.get("store", False),
-        candidate_count=candidate_count,
-        reference_multiplier=reference_multiplier,
         critique_concurrency=critique_concurrency,
-        prompt_path=prompt_path,
-        size=size,
-        reference_quality=reference_quality,
-        background=background,
-        resume=resume,
-        regen_concurrency=concurrency,
-        image_timeout_s=image_timeout_s,
         critique_timeout_s=critique_timeout_s,
-        image_retry_limit=image_retry_limit,
         critique_retry_limit=critique_retry_limit,
     )
 
-    standard_devs = [card for card in developments if card.get("card_type") != "power"]
-    power_devs = [card for card in developments if card.get("card_type") == "power"]
-    standard_with_rulebox = [card for card in standard_devs if card.get("rule_box_text")]
-    standard_plain = [card for card in standard_devs if not card.get("rule_box_text")]
 
-    candidate_tasks = (
-        _build_candidate_tasks(
-            cards=policies,
-            card_type="policy",
-            out_dir=policy_dir,
-            candidate_count=candidate_count,
-            reference_images=policy_ref_paths,
-            client=client,
-            model=model,
-            responses_model=responses_model,
-            api=api,
-            size=size,
-            quality=quality,
-            background=background,
-            resume=resume,
-        )
-        + _build_candidate_tasks(
-            cards=standard_plain,
-            card_type="development",
-            out_dir=dev_dir,
-            candidate_count=candidate_count,
-            reference_images=dev_ref_paths,
-            client=client,
-            model=model,
-            responses_model=responses_model,
-            api=api,
-            size=size,
-            quality=quality,
-            background=background,
-            resume=resume,
-        )
-        + _build_candidate_tasks(
-            cards=standard_with_rulebox,
-            card_type="development",
-            out_dir=dev_dir,
-            candidate_count=candidate_count,
-            reference_images=dev_ref_paths,
-            client=client,
-            model=model,
-            responses_model=responses_model,
-            api=api,
-            size=size,
-            quality=quality,
-            background=background,
-            resume=resume,
+async def generate_images_async(
+    config: dict[str, Any],
+    policies: list[dict[str, Any]],
+    developments: list[dict[str, Any]],
+    out_dir: Path,
+) -> None:
+    plan = await _prepare_plan(config, policies, developments, out_dir)
+    if plan.image_api_mode == "batch":
+        # The batch runner blocks on upload + poll; keep it off the loop.
+        await asyncio.to_thread(
+            _run_generation_tasks_batch,
+            plan.candidate_tasks,
+            plan.client,
+            plan.concurrency,
+            desc="Card image candidates",
+            timeout_s=plan.image_timeout_s,
+            retry_limit=plan.image_retry_limit,
         )
-        + _build_candidate_tasks(
-            cards=power_devs,
-            card_type="development",
-            out_dir=dev_dir,
-            candidate_count=candidate_count,
-            reference_images=power_ref_paths,
-            client=client,
-            model=model,
-            responses_model=responses_model,
-            api=api,
-            size=size,
-            quality=quality,
-            background=background,
-            resume=resume,
+    else:
+        await _run_generation_tasks_async(
+            plan.candidate_tasks,
+            plan.concurrency,
+            desc="Card image candidates",
+            timeout_s=plan.image_timeout_s,
+            retry_limit=plan.image_retry_limit,
+            limit_key=plan.distributed_limit_key,
         )
-    )
-
-    await _run_generation_tasks_async(
-        candidate_tasks,
-        concurrency,
-        desc="Card image candidates",
-        timeout_s=image_timeout_s,
-        retry_limit=image_retry_limit,
-    )
     await _finalize_best_candidates_async(
-        tasks=candidate_tasks,
-        client=client,
-        prompt_path=prompt_path,
-        model=critique_model,
-        reasoning_effort=text_cfg.get("reasoning_effort"),
-        store=text_cfg.get("store", False),
-        concurrency=critique_concurrency,
+        tasks=plan.candidate_tasks,
+        client=plan.client,
+        prompt_path=plan.prompt_path,
+        model=plan.critique_model,
+        reasoning_effort=plan.critique_reasoning_effort,
+        store=plan.critique_store,
+        concurrency=plan.critique_concurrency,
         desc="Card image critiques",
-        timeout_s=critique_timeout_s,
-        retry_limit=critique_retry_limit,
+        timeout_s=plan.critique_timeout_s,
+        retry_limit=plan.critique_retry_limit,
     )
 
 
-def _generate_card_images(
+async def _generate_card_images(
     *,
     card: dict[str, Any],
+    card_view: CardView,
     out_paths: list[Path],
-    reference_images: list[Path] | None,
-    client: OpenAIClient,
-    model: str | None,
-    responses_model: str | None,
-    api: str,
-    size: str | None,
-    quality: str | None,
-    background: str | None,
-    resume: bool,
+    ctx: GenerationContext,
 ) -> None:
     if not out_paths:
         return
+    client = ctx.client
+    api = ctx.api
+    reference_images = list(ctx.reference_images) or None
     pending_paths = [
-        path for path in out_paths if not (resume and path.exists() and path.stat().st_size > 0)
+        path for path in out_paths if not (ctx.resume and _nonempty(path))
     ]
     if not pending_paths:
         return
-    prompt = card.get("art_prompt") or f"Horizontal illustration for {card.get('title', 'card')}."
-    payload: dict[str, Any] = {"model": model, "prompt": prompt}
+    prompt = card_view.art_prompt or f"Horizontal illustration for {card_view.title}."
+    payload: dict[str, Any] = {"model": ctx.model, "prompt": prompt}
     if api == "images":
         payload["n"] = len(pending_paths)
-    if size is not None:
-        payload["size"] = size
-    if quality is not None:
-        payload["quality"] = quality
-    if background is not None:
-        payload["background"] = background
+    if ctx.size is not None:
+        payload["size"] = ctx.size
+    if ctx.quality is not None:
+        payload["quality"] = ctx.quality
+    if ctx.background is not None:
+        payload["background"] = ctx.background
+
+    cache_key = _image_cache_key(payload, ctx.reference_images)
+    cache_root = Path(ctx.cache_dir).expanduser() / "img" if ctx.cache_dir else None
+    cache_paths: dict[Path, Path] = {}
+    memo_keys: dict[Path, str] = {}
+    remaining: list[Path] = []
+    for idx, path in enumerate(pending_paths):
+        memo_key = f"{cache_key}_{idx:02d}"
+        memo_hit = _image_memo_get(memo_key)
+        if memo_hit is not None:
+            _link_or_copy(memo_hit, path)
+            continue
+        if cache_root is not None:
+            cached = cache_root / f"{memo_key}.png"
+            if _nonempty(cached):
+                _link_or_copy(cached, path)
+                _image_memo_put(memo_key, path)
+                continue
+            cache_paths[path] = cached
+        memo_keys[path] = memo_key
+        remaining.append(path)
+    if not remaining:
+        return
+    pending_paths = remaining
+    if api == "images":
+        payload["n"] = len(pending_paths)
+
     response: dict[str, Any] | None = None
     payload_for_cache = payload
-    try:
-        if api == "responses":
-            if len(pending_paths) > 1:
-                console.print(
-                    "[yellow]Responses API image generation does not support batching; "
-                    "limiting to one output.[/yellow]"
+    attempts = 0
+    while response is None:
+        try:
+            if api == "responses":
+                if len(pending_paths) > 1:
+                    console.print(
+                        "[yellow]Responses API image generation does not support batching; "
+                        "limiting to one output.[/yellow]"
+                    )
+                    pending_paths = pending_paths[:1]
+                payload_for_cache = client.build_image_responses_payload(
+                    prompt=prompt,
+                    response_model=ctx.responses_model,
+                    image_model=ctx.model,
+                    size=ctx.size,
+                    quality=ctx.quality,
+                    background=ctx.background,
+                    reference_images=reference_images,
                 )
-                pending_paths = pending_paths[:1]
-            payload_for_cache = client.build_image_responses_payload(
-                prompt=prompt,
-                response_model=responses_model,
-                image_model=model,
-                size=size,
-                quality=quality,
-                background=background,
-                reference_images=reference_images,
-            )
-            response = client.responses(payload_for_cache)
-        elif reference_images:
-            try:
-                response = client.images_edit(payload, reference_images)
-            except Exception as exc:  # noqa: BLE001 - fallback for edit failures
-                console.print(
-                    f"[yellow]Image edit failed for {card.get('id', 'card')}; "
-                    f"falling back to generation. Reason: {exc}[/yellow]"
+                response = await client.responses_async(payload_for_cache)
+            elif reference_images:
+                try:
+                    response = await client.images_edit_async(payload, reference_images)
+                except Exception as exc:  # noqa: BLE001 - fallback for edit failures
+                    logger.warning(
+                        "Image edit failed for %s; falling back to generation. Reason: %s",
+                        card_view.id,
+                        exc,
+                    )
+                    response = await client.images_generate_async(payload)
+            else:
+                response = await client.images_generate_async(payload)
+        except Exception as exc:  # noqa: BLE001 - guard against per-card failures
+            attempts += 1
+            # Transient 429/5xx or transport failures get a jittered backoff
+            # before we give up and write a placeholder.
+            if attempts < _API_RETRY_ATTEMPTS and _is_retryable_api_error(exc):
+                logger.warning(
+                    "Image generation hit a transient error for %s; retrying (%d/%d). Reason: %s",
+                    card_view.id,
+                    attempts,
+                    _API_RETRY_ATTEMPTS - 1,
+                    exc,
                 )
-                response = client.images_generate(payload)
-        else:
-            response = client.images_generate(payload)
-    except Exception as exc:  # noqa: BLE001 - guard against per-card failures
-        console.print(
-            f"[red]Image generation failed for {card.get('id', 'card')}. "
-            f"Saving placeholder. Reason: {exc}[/red]"
-        )
-        for path in pending_paths:
-            path.write_bytes(base64.b64decode(_DUMMY_PNG_BASE64))
-        return
+                await asyncio.sleep(min(30.0, 2.0 ** attempts + random.random()))
+                continue
+            logger.error(
+                "Image generation failed for %s. Saving placeholder. Reason: %s",
+                card_view.id,
+                exc,
+            )
+            for path in pending_paths:
+                path.write_bytes(_DUMMY_PNG_BYTES)
+            return
 
     if response is None:
         for path in pending_paths:
-            path.write_bytes(base64.b64decode(_DUMMY_PNG_BASE64))
+            path.write_bytes(_DUMMY_PNG_BYTES)
         return
 
     data_list = _extract_image_b64_list(client, response)
-    if not data_list:
-        data_list = []
-    for path, data in zip(pending_paths, data_list + [_DUMMY_PNG_BASE64] * len(pending_paths)):
+    for idx, (path, data) in enumerate(
+        zip(pending_paths, data_list + [_DUMMY_PNG_BASE64] * len(pending_paths))
+    ):
+        is_real_data = idx < len(data_list)
         try:
-            path.write_bytes(base64.b64decode(data))
+            # Multi-megabyte decode + disk write; keep it off the loop.
+            await asyncio.to_thread(_write_b64_payload, path, data)
         except Exception as exc:  # noqa: BLE001 - guard against corrupt payloads
-            console.print(
-                f"[yellow]Invalid image data for {card.get('id', 'card')}. "
-                f"Saving placeholder. Reason: {exc}[/yellow]"
+            logger.warning(
+                "Invalid image data for %s. Saving placeholder. Reason: %s",
+                card_view.id,
+                exc,
             )
-            path.write_bytes(base64.b64decode(_DUMMY_PNG_BASE64))
+            path.write_bytes(_DUMMY_PNG_BYTES)
+            continue
+        if is_real_data:
+            _image_memo_put(memo_keys[path], path)
+            if path in cache_paths:
+                _link_or_copy(path, cache_paths[path])
 
 
 def _build_candidate_tasks(
@@ -493,6 +482,7 @@ def _build_candidate_tasks(
     quality: str | None,
     background: str | None,
     resume: bool,
+    cache_dir: str | None = None,
     final_suffix: str = "",
 ) -> list[dict[str, Any]]:
     tasks: list[dict[str, Any]] = []
@@ -500,13 +490,44 @@ def _build_candidate_tasks(
         return tasks
     candidate_dir = out_dir / "candidates"
     candidate_dir.mkdir(parents=True, exist_ok=True)
+    # One scandir per directory replaces the per-card glob and the per-file
+    # stat calls resume checks would otherwise pay.
+    existing_finals = _scan_existing(out_dir) if resume else {}
+    existing_candidates_index = _scan_existing(candidate_dir) if resume else {}
+    ctx = GenerationContext(
+        client=client,
+        model=model,
+        responses_model=responses_model,
+        api=api,
+        size=size,
+        quality=quality,
+        background=background,
+        resume=resume,
+        cache_dir=cache_dir,
+        card_type=card_type,
+        reference_images=tuple(reference_images or ()),
+        is_reference=is_reference,
+    )
     for card in cards:
-        final_out_path = out_dir / f"{card['id']}{final_suffix}.png"
+        view = CardView(
+            id=card["id"],
+            title=card.get("title", "card"),
+            art_prompt=card.get("art_prompt", ""),
+            card_type=card.get("card_type"),
+        )
+        stem = f"{view.id}{final_suffix}"
+        final_out_path = out_dir / f"{stem}.png"
         alias_out_paths: list[Path] = []
-        if card_type == "development" and card.get("card_type") == "power":
-            alias_out_paths.append(out_dir / f"power_{card['id']}{final_suffix}.png")
+        if card_type == "development" and view.card_type == "power":
+            alias_out_paths.append(out_dir / f"power_{stem}.png")
+        # A card whose final output (and aliases) already exists needs no
+        # candidate tasks at all: nothing to generate and no critique to run.
+        if resume and existing_finals.get(final_out_path.name, 0) > 0 and all(
+            existing_finals.get(path.name, 0) > 0 for path in alias_out_paths
+        ):
+            continue
         existing_candidates = (
-            _find_existing_candidates(candidate_dir, card["id"], final_suffix)
+            _find_existing_candidates(existing_candidates_index, candidate_dir, stem)
             if resume
             else []
         )
@@ -514,71 +535,100 @@ def _build_candidate_tasks(
             candidate_paths = existing_candidates
         else:
             candidate_paths = [
-                candidate_dir / f"{card['id']}{final_suffix}_cand_{idx:02d}.png"
+                candidate_dir / f"{stem}_cand_{idx:02d}.png"
                 for idx in range(candidate_count)
             ]
         for candidate_path in candidate_paths:
             tasks.append(
                 {
                     "card": card,
+                    "card_view": view,
                     "out_path": candidate_path,
+                    "out_name": candidate_path.name,
                     "final_out_path": final_out_path,
                     "alias_out_paths": alias_out_paths,
-                    "card_type": card_type,
-                    "reference_images": reference_images,
-                    "is_reference": is_reference,
-                    "client": client,
-                    "model": model,
-                    "responses_model": responses_model,
-                    "api": api,
-                    "size": size,
-                    "quality": quality,
-                    "background": background,
-                    "resume": resume,
+                    "ctx": ctx,
                 }
             )
     return tasks
 
 
-def _find_existing_candidates(candidate_dir: Path, card_id: str, final_suffix: str) -> list[Path]:
-    pattern = f"{card_id}{final_suffix}_cand_*"
-    matches = [
-        path
-        for path in sorted(candidate_dir.glob(pattern))
-        if path.is_file() and path.stat().st_size > 0
-    ]
-    return matches
+def _image_cache_key(payload: dict[str, Any], reference_images: tuple[Path, ...] = ()) -> str:
+    # Copy-and-pop beats a filtering comprehension: one bulk copy instead of
+    # a per-key conditional, and "n" is the only key excluded from the key.
+    keyed = dict(payload)
+    keyed.pop("n", None)
+    hasher = hashlib.sha256(json.dumps(keyed, sort_keys=True).encode("utf-8"))
+    # Reference-guided results depend on the reference bytes, not just the
+    # prompt; fold each reference's content digest into the key so cache
+    # hits cannot cross different reference sets.
+    for path in reference_images:
+        try:
+            digest = _file_digest_cached(os.fspath(path), os.stat(path).st_mtime_ns)
+        except OSError:
+            digest = os.fspath(path)
+        hasher.update(digest.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _file_digest_cached(path_str: str, mtime_ns: int) -> str:
+    digest = hashlib.sha256()
+    with open(path_str, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# In-run memo for identical generation payloads: cards that share an art
+# prompt link from the first written candidate instead of re-hitting the
+# API or the on-disk cache. Values are paths, not bytes, so the memo stays
+# small; entries whose file has since been cleaned up are dropped on read.
+_IMAGE_MEMO_MAX = 256
+_image_memo: OrderedDict[str, Path] = OrderedDict()
+_image_memo_lock = threading.Lock()
+
+
+def _image_memo_get(key: str) -> Path | None:
+    with _image_memo_lock:
+        path = _image_memo.get(key)
+        if path is None:
+            return None
+        _image_memo.move_to_end(key)
+    if not _nonempty(path):
+        with _image_memo_lock:
+            _image_memo.pop(key, None)
+        return None
+    return path
 
 
-def _finalize_best_candidates(
-    *,
-    tasks: list[dict[str, Any]],
-    client: OpenAIClient,
-    prompt_path: str | None,
-    model: str | None,
-    reasoning_effort: str | None,
-    store: bool,
-    concurrency: int,
-    desc: str,
-    timeout_s: float | None = None,
-    retry_limit: int = 0,
-) -> None:
-    if not tasks:
-        return
-    run_async(
-        _finalize_best_candidates_async(
-            tasks=tasks,
-            client=client,
-            prompt_path=prompt_path,
-            model=model,
-            reasoning_effort=reasoning_effort,
-            store=store,
-            concurrency=concurrency,
-            desc=desc,
-            timeout_s=timeout_s,
-            retry_limit=retry_limit,
-        )
-    )
+def _image_memo_put(key: str, path: Path) -> None:
+    with _image_memo_lock:
+        _image_memo[key] = path
+        _image_memo.move_to_end(key)
+        while len(_image_memo) > _IMAGE_MEMO_MAX:
+            _image_memo.popitem(last=False)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _find_existing_candidates(
+    index: dict[str, int], candidate_dir: Path, stem: str
+) -> list[Path]:
+    prefix = f"{stem}_cand_"
+    return [
+        candidate_dir / name
+        for name in sorted(index)
+        if name.startswith(prefix) and index[name] > 0
+    ]
 
 
 async def _finalize_best_candidates_async(
@@ -625,27 +675,44 @@ async def _score_candidates_async(
     timeout_s: float | None = None,
     retry_limit: int = 0,
 ) -> list[int]:
+    # All candidates for a card share one multi-image critique request, so
+    # the API cost scales with cards rather than candidate count.
+    grouped: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+    for position, task in enumerate(tasks):
+        grouped.setdefault(task["card_view"].id, []).append((position, task))
+
+    # A lone candidate wins by default; critiquing it would spend a request
+    # with no decision to make. _select_best_candidates picks the only entry
+    # in its group regardless of score, so zeros are fine here.
+    scores = [0] * len(tasks)
+    grouped = {card_id: entries for card_id, entries in grouped.items() if len(entries) > 1}
+    if not grouped:
+        return scores
+
     adjusted_concurrency = _adjust_text_concurrency_for_images(concurrency)
-    resolved_concurrency = _resolve_concurrency(len(tasks), adjusted_concurrency)
-    return await gather_with_concurrency(
+    resolved_concurrency = _resolve_concurrency(len(grouped), adjusted_concurrency)
+    group_scores = await bounded_map(
         resolved_concurrency,
-        [
-            lambda task=task: _critique_image_task(
-                task=task,
-                client=client,
-                prompt_path=prompt_path,
-                model=model,
-                reasoning_effort=reasoning_effort,
-                store=store,
-                timeout_s=timeout_s,
-                retry_limit=retry_limit,
-            )
-            for task in tasks
-        ],
+        lambda entries: _critique_card_task(
+            tasks=[task for _, task in entries],
+            client=client,
+            prompt_path=prompt_path,
+            model=model,
+            reasoning_effort=reasoning_effort,
+            store=store,
+            timeout_s=timeout_s,
+            retry_limit=retry_limit,
+        ),
+        list(grouped.values()),
         timeout=timeout_s,
         progress_desc=progress_desc,
     )
 
+    for entries, entry_scores in zip(grouped.values(), group_scores):
+        for (position, _), score in zip(entries, entry_scores):
+            scores[position] = score
+    return scores
+
 
 _CANDIDATE_KEEP_COUNT = 2
 
@@ -656,21 +723,26 @@ def _select_best_candidates(tasks: list[dict[str, Any]], scores: list[int]) -> N
         card_id = task["card"]["id"]
         grouped.setdefault(card_id, []).append((task, score))
 
+    unlink_targets: list[Path] = []
     for card_id, entries in grouped.items():
         max_score = max(score for _, score in entries)
         top_entries = [task for task, score in entries if score == max_score]
-        chosen_task = random.choice(top_entries)
+        # Deterministic tie-break on the candidate index keeps reruns and
+        # resumed runs picking the same winner for the same scores.
+        chosen_task = min(top_entries, key=itemgetter("out_name"))
         final_path = chosen_task["final_out_path"]
-        final_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copyfile(chosen_task["out_path"], final_path)
+        _link_or_copy(chosen_task["out_path"], final_path)
         for alias_path in chosen_task.get("alias_out_paths", []):
-            alias_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copyfile(chosen_task["out_path"], alias_path)
+            _link_or_copy(chosen_task["out_path"], alias_path)
 
-        sorted_entries = sorted(entries, key=lambda entry: entry[1], reverse=True)
-        keep_limit = max(0, min(_CANDIDATE_KEEP_COUNT, len(sorted_entries) - 1))
+        # Only the top keep_limit+1 entries matter; nlargest is O(n log k)
+        # versus a full sort and skips per-comparison lambda dispatch.
+        top_entries_by_score = heapq.nlargest(
+            _CANDIDATE_KEEP_COUNT + 1, entries, key=itemgetter(1)
+        )
+        keep_limit = max(0, min(_CANDIDATE_KEEP_COUNT, len(entries) - 1))
         keep_paths: set[Path] = set()
-        for task, _ in sorted_entries:
+        for task, _ in top_entries_by_score:
             if task["out_path"] == chosen_task["out_path"]:
                 continue
             keep_paths.add(task["out_path"])
@@ -680,22 +752,45 @@ def _select_best_candidates(tasks: list[dict[str, Any]], scores: list[int]) -> N
         for task, _ in entries:
             if task["out_path"] in keep_paths:
                 continue
-            if task["out_path"].exists():
-                task["out_path"].unlink(missing_ok=True)
+            unlink_targets.append(task["out_path"])
 
+    # The sweep is thousands of blocking syscalls at full candidate counts;
+    # fanning them over a small thread pool keeps them off the event loop.
+    if unlink_targets:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(_safe_unlink, unlink_targets))
     _cleanup_candidate_dirs(tasks)
 
 
+def _safe_unlink(path: Path) -> None:
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
 def _cleanup_candidate_dirs(tasks: list[dict[str, Any]]) -> None:
-    candidate_dirs = {task["out_path"].parent for task in tasks}
-    for candidate_dir in candidate_dirs:
-        if candidate_dir.exists() and not any(candidate_dir.iterdir()):
+    def _remove_if_empty(candidate_dir: Path) -> None:
+        try:
+            with os.scandir(candidate_dir) as entries:
+                if next(entries, None) is not None:
+                    return
             candidate_dir.rmdir()
+        except OSError:
+            pass
 
+    candidate_dirs = {task["out_path"].parent for task in tasks}
+    if not candidate_dirs:
+        return
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(16, len(candidate_dirs))
+    ) as executor:
+        list(executor.map(_remove_if_empty, candidate_dirs))
 
-async def _critique_image_task(
+
+async def _critique_card_task(
     *,
-    task: dict[str, Any],
+    tasks: list[dict[str, Any]],
     client: OpenAIClient,
     prompt_path: str | None,
     model: str | None,
@@ -703,27 +798,42 @@ async def _critique_image_task(
     store: bool,
     timeout_s: float | None,
     retry_limit: int = 0,
-) -> int:
-    out_path = task["out_path"]
-    if not out_path.exists() or out_path.stat().st_size == 0:
-        return 0
-    card = task["card"]
-    card_type = task["card_type"]
-    is_reference = bool(task.get("is_reference"))
-    reference_images = None if is_reference else task.get("reference_images")
+) -> list[int]:
+    scores = [0] * len(tasks)
+    valid = [
+        (position, task)
+        for position, task in enumerate(tasks)
+        if _nonempty(task["out_path"])
+    ]
+    if not valid:
+        return scores
+    card = tasks[0]["card"]
+    card_id = tasks[0]["card_view"].id
+    ctx = tasks[0]["ctx"]
+    card_type = ctx.card_type
+    reference_images = None if ctx.is_reference else (list(ctx.reference_images) or None)
     if client.use_dummy or not client.api_key:
-        return int(dummy_image_critique(card=card, card_type=card_type).get("rating", 0))
+        for position, task in valid:
+            scores[position] = int(
+                dummy_image_critique(card=card, card_type=card_type).get("rating", 0)
+            )
+        return scores
     prompt = render_prompt(
-        "image_critique.jinja",
+        "image_critique_batch.jinja",
         prompt_path=prompt_path,
         card=card,
         card_type=card_type,
+        candidate_count=len(valid),
         reference_image_provided=bool(reference_images),
     )
-    payload = _build_image_critique_payload(
+    # Payload assembly base64-encodes multi-MB PNGs; run it in a worker
+    # thread so it cannot stall concurrent critique requests on the loop.
+    payload = await asyncio.to_thread(
+        _build_image_critique_payload,
+        client=client,
         prompt=prompt,
         model=model,
-        image_path=out_path,
+        image_paths=[task["out_path"] for _, task in valid],
         reference_image_paths=reference_images,
         reasoning_effort=reasoning_effort,
         store=store,
@@ -741,61 +851,78 @@ async def _critique_image_task(
         except asyncio.TimeoutError:
             attempts += 1
             last_exc = asyncio.TimeoutError(
-                f"Image critique timed out for {card.get('id', 'card')}."
+                f"Image critique timed out for {card_id}."
             )
             if attempts > retry_limit:
-                console.print(f"[red]{last_exc}[/red]")
-                return 0
-            console.print(
-                f"[yellow]Image critique timed out for {card.get('id', 'card')}; retrying "
-                f"({attempts}/{retry_limit}).[/yellow]"
+                logger.error("Image critique timed out for %s.", card_id)
+                return scores
+            logger.warning(
+                "Image critique timed out for %s; retrying (%d/%d).",
+                card_id,
+                attempts,
+                retry_limit,
             )
             await asyncio.sleep(_retry_delay_s(attempts))
         except Exception as exc:  # noqa: BLE001 - keep image runs resilient
             attempts += 1
             last_exc = exc
             if attempts > retry_limit:
-                console.print(
-                    f"[red]Image critique failed for {card.get('id', 'card')}. "
-                    f"Reason: {exc!r}[/red]"
+                logger.error(
+                    "Image critique failed for %s. Reason: %r", card_id, exc
                 )
-                return 0
-            console.print(
-                f"[yellow]Image critique failed for {card.get('id', 'card')}; retrying "
-                f"({attempts}/{retry_limit}). Reason: {exc!r}[/yellow]"
+                return scores
+            logger.warning(
+                "Image critique failed for %s; retrying (%d/%d). Reason: %r",
+                card_id,
+                attempts,
+                retry_limit,
+                exc,
             )
             await asyncio.sleep(_retry_delay_s(attempts))
     if response is None:
-        console.print(
-            "[red]Image critique returned no response after retries."
-            f" Last error: {last_exc!r}[/red]"
+        logger.error(
+            "Image critique returned no response after retries. Last error: %r", last_exc
         )
-        return 0
+        return scores
     parsed = _parse_image_critique_response(response)
     if parsed is None:
-        console.print("[red]Image critique response could not be parsed.[/red]")
-        return 0
-    return int(parsed.get("rating", 0))
+        logger.error("Image critique response could not be parsed.")
+        return scores
+    for entry in parsed.get("ratings", []):
+        if not isinstance(entry, dict):
+            continue
+        try:
+            index = int(entry.get("index", -1))
+            rating = int(entry.get("rating", 0))
+        except (TypeError, ValueError):
+            continue
+        if 0 <= index < len(valid):
+            scores[valid[index][0]] = rating
+    return scores
 
 
 def _build_image_critique_payload(
     *,
+    client: OpenAIClient,
     prompt: str,
     model: str | None,
-    image_path: Path,
+    image_paths: list[Path],
     reference_image_paths: list[Path] | None,
     reasoning_effort: str | None,
     store: bool,
 ) -> dict[str, Any]:
-    content: list[dict[str, Any]] = [
-        {"type": "input_text", "text": prompt},
-        {"type": "input_image", "image_url": _encode_image_data_url(image_path)},
-    ]
+    content: list[dict[str, Any]] = [{"type": "input_text", "text": prompt}]
+    for image_path in image_paths:
+        content.append({"type": "input_image", "image_url": _encode_image_data_url(image_path)})
     if reference_image_paths:
         for reference_image_path in reference_image_paths:
-            content.append(
-                {"type": "input_image", "image_url": _encode_image_data_url(reference_image_path)}
-            )
+            file_id = _reference_file_id(client, reference_image_path)
+            if file_id:
+                content.append({"type": "input_image", "file_id": file_id})
+            else:
+                content.append(
+                    {"type": "input_image", "image_url": _encode_reference_data_url(reference_image_path)}
+                )
     return {
         "model": model,
         "input": [
@@ -807,8 +934,8 @@ def _build_image_critique_payload(
         "text": {
             "format": {
                 "type": "json_schema",
-                "name": "image_critique",
-                "schema": IMAGE_CRITIQUE_SCHEMA,
+                "name": "image_critique_batch",
+                "schema": IMAGE_CRITIQUE_BATCH_SCHEMA,
                 "strict": True,
             }
         },
@@ -818,25 +945,58 @@ def _build_image_critique_payload(
 
 
 def _parse_image_critique_response(response: dict[str, Any]) -> dict[str, Any] | None:
-    for output in response.get("output", []):
-        for item in output.get("content", []):
-            if item.get("json") and isinstance(item["json"], dict):
-                return item["json"]
-            text = item.get("text") or item.get("json")
-            if text:
-                try:
-                    parsed = json.loads(text)
-                except json.JSONDecodeError:
-                    return None
-                if isinstance(parsed, dict):
-                    return parsed
+    for output in response.get("output", ()):
+        for item in output.get("content", ()):
+            parsed = item.get("json")
+            if isinstance(parsed, dict):
+                return parsed
+            text = item.get("text")
+            if not text:
+                continue
+            try:
+                # json_loads routes through orjson when the speed extra is
+                # installed; batched critique responses are several KB each.
+                parsed = json_loads(text)
+            except ValueError:
+                # Keep scanning: a sibling item may still carry the payload.
+                continue
+            if isinstance(parsed, dict):
+                return parsed
     return None
 
 
 def _encode_image_data_url(path: Path) -> str:
+    # One bytes join and a no-op ASCII decode instead of an f-string over a
+    # multi-megabyte str; candidate PNGs pass through here per critique.
     mime = _guess_image_mime(path)
-    data = base64.b64encode(path.read_bytes()).decode("utf-8")
-    return f"data:{mime};base64,{data}"
+    encoded = base64.b64encode(path.read_bytes())
+    return b"".join((b"data:", mime.encode("ascii"), b";base64,", encoded)).decode("ascii")
+
+
+@lru_cache(maxsize=32)
+def _encode_reference_data_url(path: Path) -> str:
+    # Reference images are identical across every candidate critique of a
+    # card type, so encode each one exactly once per process.
+    return _encode_image_data_url(path)
+
+
+_reference_file_ids: dict[str, str | None] = {}
+_reference_file_ids_lock = threading.Lock()
+
+
+def _reference_file_id(client: OpenAIClient, path: Path) -> str | None:
+    """Upload a reference image once and memoize its Files API id.
+
+    Every critique request shares the same handful of reference PNGs;
+    sending a file id instead of an inline data URL keeps multi-MB base64
+    blobs out of each request body. Returns None (and remembers it) when
+    upload is unavailable so callers fall back to inline data.
+    """
+    key = str(path)
+    with _reference_file_ids_lock:
+        if key not in _reference_file_ids:
+            _reference_file_ids[key] = client.upload_file(path)
+        return _reference_file_ids[key]
 
 
 def _guess_image_mime(path: Path) -> str:
@@ -850,7 +1010,7 @@ def _guess_image_mime(path: Path) -> str:
     return "application/octet-stream"
 
 
-def _prepare_reference_images(
+async def _prepare_reference_images(
     *,
     api: str,
     reference_policy: str | None,
@@ -874,6 +1034,7 @@ def _prepare_reference_images(
     reference_quality: str | None,
     background: str | None,
     resume: bool,
+    cache_dir: str | None,
     regen_concurrency: int,
     image_timeout_s: float | None,
     critique_timeout_s: float | None,
@@ -896,7 +1057,7 @@ def _prepare_reference_images(
     if policy_ref_paths is None and policies:
         reference_card = policies[0]
         policy_reference_out = policy_dir / f"{reference_card['id']}_reference.png"
-        if resume and policy_reference_out.exists() and policy_reference_out.stat().st_size > 0:
+        if resume and _nonempty(policy_reference_out):
             policy_ref_paths = [policy_reference_out]
         else:
             reference_tasks.extend(
@@ -915,6 +1076,7 @@ def _prepare_reference_images(
                     quality=reference_quality,
                     background=background,
                     resume=resume,
+                    cache_dir=cache_dir,
                     final_suffix="_reference",
                 )
             )
@@ -925,7 +1087,7 @@ def _prepare_reference_images(
             developments[0],
         )
         dev_reference_out = dev_dir / f"{reference_card['id']}_reference.png"
-        if resume and dev_reference_out.exists() and dev_reference_out.stat().st_size > 0:
+        if resume and _nonempty(dev_reference_out):
             dev_ref_paths = [dev_reference_out]
         else:
             reference_tasks.extend(
@@ -944,6 +1106,7 @@ def _prepare_reference_images(
                     quality=reference_quality,
                     background=background,
                     resume=resume,
+                    cache_dir=cache_dir,
                     final_suffix="_reference",
                 )
             )
@@ -955,7 +1118,7 @@ def _prepare_reference_images(
         )
         if reference_card is not None:
             power_reference_out = dev_dir / f"{reference_card['id']}_power_reference.png"
-            if resume and power_reference_out.exists() and power_reference_out.stat().st_size > 0:
+            if resume and _nonempty(power_reference_out):
                 power_ref_paths = [power_reference_out]
             else:
                 reference_tasks.extend(
@@ -974,19 +1137,20 @@ def _prepare_reference_images(
                         quality=reference_quality,
                         background=background,
                         resume=resume,
+                        cache_dir=cache_dir,
                         final_suffix="_power_reference",
                     )
                 )
 
     if reference_tasks:
-        _run_generation_tasks(
+        await _run_generation_tasks_async(
             reference_tasks,
             regen_concurrency,
             desc="Reference image candidates",
             timeout_s=image_timeout_s,
             retry_limit=image_retry_limit,
         )
-        _finalize_best_candidates(
+        await _finalize_best_candidates_async(
             tasks=reference_tasks,
             client=client,
             prompt_path=prompt_path,
@@ -1013,23 +1177,47 @@ def _resolve_reference_paths(reference_path: str | None) -> list[Path] | None:
     if reference_path:
         reference_paths = _gather_reference_paths(reference_path)
         if reference_paths:
-            return reference_paths
+            return list(reference_paths)
         console.print(
             "[yellow]Reference image(s) not found or empty. Generating a fresh reference.[/yellow]"
         )
     return None
 
 
-def _gather_reference_paths(reference_path: str) -> list[Path]:
+_GLOB_MAGIC = re.compile(r"[*?\[]")
+_ALLOWED_IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".webp"})
+
+
+@lru_cache(maxsize=128)
+def _expand_glob(pattern: str) -> tuple[Path, ...]:
+    # Expanding a wildcard walks the directory tree; memoize per pattern so
+    # repeat lookups within a run skip the traversal. Splitting the static
+    # prefix off and globbing from there lets pathlib walk only the wild
+    # portion instead of re-statting every component the way glob.glob does.
+    parts = Path(pattern).parts
+    for index, part in enumerate(parts):
+        if _GLOB_MAGIC.search(part):
+            break
+    else:
+        path = Path(pattern)
+        return (path,) if path.exists() else ()
+    root = Path(*parts[:index]) if index else Path(".")
+    return tuple(sorted(root.glob(str(Path(*parts[index:])))))
+
+
+@lru_cache(maxsize=32)
+def _gather_reference_paths(reference_path: str) -> tuple[Path, ...]:
+    # Memoized per configured value: the same reference string is resolved
+    # for the policy, development, and power slots on every plan build, and
+    # each resolution costs expanduser/exists/stat syscalls per part.
     paths: list[Path] = []
     parts = [part.strip() for part in reference_path.split(",") if part.strip()]
     if not parts:
-        return paths
+        return ()
     for part in parts:
         expanded = Path(part).expanduser()
-        if any(char in part for char in ["*", "?", "["]):
-            matches = sorted(Path(match) for match in glob.glob(str(expanded)))
-            paths.extend([match for match in matches if match.is_file()])
+        if _GLOB_MAGIC.search(part):
+            paths.extend(match for match in _expand_glob(str(expanded)) if match.is_file())
             continue
         if expanded.exists():
             if expanded.is_dir():
@@ -1038,29 +1226,45 @@ def _gather_reference_paths(reference_path: str) -> list[Path]:
                 paths.append(expanded)
             continue
         console.print(f"[yellow]Reference image not found at {expanded}.[/yellow]")
+    # Dedupe on (device, inode): one stat per path instead of the symlink
+    # walk a resolve() per candidate would cost.
     deduped: list[Path] = []
-    seen: set[Path] = set()
+    seen: set[tuple[int, int]] = set()
     for path in paths:
-        resolved = path.resolve()
-        if resolved in seen:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            continue
+        key = (stat_result.st_dev, stat_result.st_ino)
+        if key in seen:
             continue
-        seen.add(resolved)
-        deduped.append(resolved)
-    return deduped
+        seen.add(key)
+        deduped.append(path if path.is_absolute() else path.resolve())
+    return tuple(deduped)
 
 
 def _list_image_files(directory: Path) -> list[Path]:
-    allowed = {".png", ".jpg", ".jpeg", ".webp"}
-    files = [
-        path
-        for path in sorted(directory.iterdir())
-        if path.is_file() and path.suffix.lower() in allowed
-    ]
+    files = list(_list_image_files_cached(directory, directory.stat().st_mtime_ns))
     if not files:
         console.print(f"[yellow]No reference images found in directory {directory}.[/yellow]")
     return files
 
 
+@lru_cache(maxsize=32)
+def _list_image_files_cached(directory: Path, mtime_ns: int) -> tuple[Path, ...]:
+    # Keyed on the directory mtime so an unchanged directory is listed once
+    # per run while edits still invalidate the entry. scandir's DirEntry
+    # carries the file type from the directory read itself, so no per-entry
+    # stat is needed the way iterdir() + is_file() would.
+    with os.scandir(directory) as entries:
+        return tuple(
+            Path(entry.path)
+            for entry in sorted(entries, key=lambda entry: entry.name)
+            if entry.is_file(follow_symlinks=False)
+            and os.path.splitext(entry.name)[1].lower() in _ALLOWED_IMAGE_SUFFIXES
+        )
+
+
 def _merge_reference_paths(
     primary: list[Path] | None,
     secondary: list[Path] | None,
@@ -1082,20 +1286,181 @@ def _run_generation_tasks(
     desc: str,
     timeout_s: float | None = None,
     retry_limit: int = 0,
+    limit_key: str | None = None,
 ) -> None:
     if not tasks:
         return
     run_async(
         _run_generation_tasks_async(
-            _build_generation_batches(tasks),
+            tasks,
             concurrency,
             desc=desc,
             timeout_s=timeout_s,
             retry_limit=retry_limit,
+            limit_key=limit_key,
         )
     )
 
 
+_BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _run_generation_tasks_batch(
+    tasks: list[dict[str, Any]],
+    client: OpenAIClient,
+    concurrency: int,
+    *,
+    desc: str,
+    timeout_s: float | None = None,
+    retry_limit: int = 0,
+    poll_interval_s: float = 30.0,
+) -> None:
+    """Run plain image generations through the OpenAI Batch API.
+
+    All batchable payloads are written to one JSONL input file, uploaded
+    once, and polled as a single batch job, trading turnaround time for
+    roughly half the list price and no per-request rate limiting. Tasks
+    that need the edits or responses endpoints (reference-guided
+    generation) are not batchable and fall through to the direct driver,
+    as does everything when the upload or the batch job fails.
+    """
+    if not tasks:
+        return
+    if client.use_dummy or not client.api_key:
+        _run_generation_tasks(
+            tasks, concurrency, desc=desc, timeout_s=timeout_s, retry_limit=retry_limit
+        )
+        return
+
+    direct_tasks = [
+        task for task in tasks if task["ctx"].api != "images" or task["ctx"].reference_images
+    ]
+    batchable_tasks = [
+        task
+        for task in tasks
+        if task["ctx"].api == "images" and not task["ctx"].reference_images
+    ]
+    slots: list[dict[str, Any]] = []
+    lines: list[bytes] = []
+    for batch in _build_generation_batches(batchable_tasks):
+        ctx = batch["ctx"]
+        pending = [
+            path for path in batch["out_paths"] if not (ctx.resume and _nonempty(path))
+        ]
+        if not pending:
+            continue
+        view = batch["card_view"]
+        prompt = view.art_prompt or f"Horizontal illustration for {view.title}."
+        payload: dict[str, Any] = {"model": ctx.model, "prompt": prompt, "n": len(pending)}
+        for key in ("size", "quality", "background"):
+            value = getattr(ctx, key)
+            if value is not None:
+                payload[key] = value
+        lines.append(
+            json.dumps(
+                {
+                    "custom_id": f"task-{len(slots)}",
+                    "method": "POST",
+                    "url": "/v1/images/generations",
+                    "body": payload,
+                }
+            ).encode("utf-8")
+        )
+        slots.append({"out_paths": pending, "card_view": view})
+
+    if direct_tasks:
+        _run_generation_tasks(
+            direct_tasks, concurrency, desc=f"{desc} (direct)",
+            timeout_s=timeout_s, retry_limit=retry_limit,
+        )
+    if not slots:
+        return
+
+    console.print(f"[cyan]{desc}: submitting {len(slots)} requests via the Batch API[/cyan]")
+    with tempfile.NamedTemporaryFile(
+        "wb", prefix="deckgen_batch_", suffix=".jsonl", delete=False
+    ) as handle:
+        handle.write(b"\n".join(lines) + b"\n")
+        input_path = Path(handle.name)
+    records: dict[str, dict[str, Any]] = {}
+    try:
+        # The upload sits inside the fallback guard with the rest of the
+        # batch flow: any failure here must degrade to the direct driver,
+        # not abort the run.
+        try:
+            file_id = client.upload_file(input_path, purpose="batch")
+        finally:
+            input_path.unlink(missing_ok=True)
+        if file_id:
+            job = client.batches_create(
+                {
+                    "input_file_id": file_id,
+                    "endpoint": "/v1/images/generations",
+                    "completion_window": "24h",
+                }
+            )
+            attempts = 0
+            while job.get("status") not in _BATCH_TERMINAL_STATUSES:
+                time.sleep(max(poll_interval_s, _retry_delay_s(attempts)))
+                attempts += 1
+                job = client.batches_retrieve(job["id"])
+            output_file_id = job.get("output_file_id")
+            if job.get("status") != "completed":
+                logger.error("Image batch job ended with status %s.", job.get("status"))
+            if output_file_id:
+                for line in client.file_content(output_file_id).splitlines():
+                    if not line.strip():
+                        continue
+                    record = json_loads(line)
+                    custom_id = record.get("custom_id")
+                    if custom_id:
+                        records[custom_id] = record
+    except Exception as exc:  # noqa: BLE001 - fall back to direct generation
+        logger.error("Image batch run failed; falling back to direct calls. Reason: %r", exc)
+        records = {}
+
+    missing: list[dict[str, Any]] = []
+    for idx, slot in enumerate(slots):
+        record = records.get(f"task-{idx}")
+        body = ((record or {}).get("response") or {}).get("body") or {}
+        data_list = [
+            item.get("b64_json")
+            for item in body.get("data", [])
+            if isinstance(item, dict) and item.get("b64_json")
+        ]
+        if not data_list:
+            missing.append(slot)
+            continue
+        for path, data in zip(slot["out_paths"], data_list):
+            try:
+                _write_b64_payload(path, data)
+            except Exception as exc:  # noqa: BLE001 - guard against corrupt payloads
+                logger.warning(
+                    "Invalid batch image data for %s. Saving placeholder. Reason: %s",
+                    slot["card_view"].id,
+                    exc,
+                )
+                path.write_bytes(_DUMMY_PNG_BYTES)
+        for path in slot["out_paths"][len(data_list):]:
+            missing.append({"out_paths": [path], "card_view": slot["card_view"]})
+
+    if missing:
+        retry_tasks = [
+            task
+            for task in tasks
+            if any(task["out_path"] in slot["out_paths"] for slot in missing)
+        ]
+        if retry_tasks:
+            console.print(
+                f"[yellow]{desc}: {len(retry_tasks)} requests missing from batch output; "
+                "retrying directly.[/yellow]"
+            )
+            _run_generation_tasks(
+                retry_tasks, concurrency, desc=f"{desc} (retry)",
+                timeout_s=timeout_s, retry_limit=retry_limit,
+            )
+
+
 async def _run_generation_tasks_async(
     tasks: list[dict[str, Any]],
     concurrency: int,
@@ -1103,106 +1468,142 @@ async def _run_generation_tasks_async(
     desc: str,
     timeout_s: float | None = None,
     retry_limit: int = 0,
+    limit_key: str | None = None,
 ) -> None:
     if not tasks:
         return
-    if tasks and "out_path" in tasks[0]:
-        tasks = _build_generation_batches(tasks)
+    # Sole batching point: callers always pass raw candidate tasks.
+    tasks = _build_generation_batches(tasks)
+    if not tasks:
+        return
     resolved_concurrency = _resolve_concurrency(len(tasks), concurrency)
     console.print(
         f"[cyan]{desc}: running {len(tasks)} tasks with concurrency {resolved_concurrency}[/cyan]"
     )
-    semaphore = asyncio.Semaphore(resolved_concurrency)
+    # A shared limit key bounds concurrency across every process using it;
+    # without one the plain per-process semaphore applies.
+    semaphore: asyncio.Semaphore | CrossProcessSemaphore
+    if limit_key:
+        semaphore = CrossProcessSemaphore(limit_key, resolved_concurrency)
+    else:
+        semaphore = asyncio.Semaphore(resolved_concurrency)
 
     async def _run_task(task: dict[str, Any]) -> None:
         async with semaphore:
             attempts = 0
             while attempts <= retry_limit:
                 try:
-                    thread_task = asyncio.to_thread(_generate_card_images, **task)
                     if timeout_s is not None and timeout_s > 0:
-                        await asyncio.wait_for(thread_task, timeout=timeout_s)
+                        await asyncio.wait_for(_generate_card_images(**task), timeout=timeout_s)
                     else:
-                        await thread_task
+                        await _generate_card_images(**task)
                     return
                 except asyncio.TimeoutError:
                     attempts += 1
                     if attempts > retry_limit:
-                        console.print(
-                            "[yellow]Image task timed out; skipping remaining work for that task.[/yellow]"
+                        logger.warning(
+                            "Image task timed out; skipping remaining work for that task."
                         )
                         return
-                    console.print(
-                        "[yellow]Image task timed out; retrying "
-                        f"({attempts}/{retry_limit}).[/yellow]"
+                    logger.warning(
+                        "Image task timed out; retrying (%d/%d).", attempts, retry_limit
                     )
                     await asyncio.sleep(_retry_delay_s(attempts))
                 except Exception as exc:  # noqa: BLE001 - best-effort image runs
                     attempts += 1
                     if attempts > retry_limit:
-                        console.print(f"[yellow]Image task failed. Reason: {exc!r}[/yellow]")
+                        logger.warning("Image task failed. Reason: %r", exc)
                         return
-                    console.print(
-                        "[yellow]Image task failed; retrying "
-                        f"({attempts}/{retry_limit}). Reason: {exc!r}[/yellow]"
+                    logger.warning(
+                        "Image task failed; retrying (%d/%d). Reason: %r",
+                        attempts,
+                        retry_limit,
+                        exc,
                     )
                     await asyncio.sleep(_retry_delay_s(attempts))
 
-    coros = [_run_task(task) for task in tasks]
-    for coro in tqdm(asyncio.as_completed(coros), total=len(coros), desc=desc):
-        await coro
+    # Awaiting one gather instead of iterating tqdm(as_completed(...))
+    # avoids materializing the completion generator and lets cancellation
+    # propagate to every in-flight task. (asyncio.TaskGroup would be the
+    # natural fit but the package still supports Python 3.10.)
+    progress = tqdm(total=len(tasks), desc=desc)
+
+    async def _tracked(task: dict[str, Any]) -> None:
+        await _run_task(task)
+        progress.update(1)
+
+    try:
+        await asyncio.gather(*(_tracked(task) for task in tasks))
+    finally:
+        progress.close()
+
+
+def _scan_existing(directory: Path) -> dict[str, int]:
+    """Index one directory's file sizes in a single scandir pass."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+    except OSError:
+        return {}
 
 
 def _build_generation_batches(tasks: list[dict[str, Any]], max_batch_size: int = 10) -> list[dict[str, Any]]:
+    # Resume filtering stats every candidate; one scandir per output dir
+    # replaces the per-task stat calls, which dominate startup on resumed
+    # runs over network filesystems.
+    existing_sizes: dict[Path, dict[str, int]] = {}
+
+    def _existing_size(path: Path) -> int:
+        index = existing_sizes.get(path.parent)
+        if index is None:
+            index = _scan_existing(path.parent)
+            existing_sizes[path.parent] = index
+        return index.get(path.name, 0)
+
+    first_api = tasks[0]["ctx"].api if tasks else None
+    if first_api != "images":
+        # Non-images APIs generate one image per call, so every pending
+        # task is its own batch; grouping would just build one bucket per
+        # task and immediately unpack it again.
+        return [
+            _batch_from_chunk([task])
+            for task in tasks
+            if not (task["ctx"].resume and _existing_size(task["out_path"]) > 0)
+        ]
+
+    # The frozen context hashes all the settings the old per-field key
+    # spelled out, so (card, context) fully identifies a batchable group.
     grouped: dict[tuple[Any, ...], list[dict[str, Any]]] = {}
     for task in tasks:
-        if task.get("resume") and task["out_path"].exists() and task["out_path"].stat().st_size > 0:
+        if task["ctx"].resume and _existing_size(task["out_path"]) > 0:
             continue
-        reference_images = tuple(str(path) for path in (task.get("reference_images") or []))
-        key = (
-            task["card"]["id"],
-            task.get("is_reference", False),
-            task.get("api"),
-            task.get("model"),
-            task.get("responses_model"),
-            task.get("size"),
-            task.get("quality"),
-            task.get("background"),
-            reference_images,
-        )
-        grouped.setdefault(key, []).append(task)
+        grouped.setdefault((task["card_view"].id, task["ctx"]), []).append(task)
 
     batches: list[dict[str, Any]] = []
     for grouped_tasks in grouped.values():
-        grouped_tasks.sort(key=lambda item: item["out_path"].name)
-        api = grouped_tasks[0].get("api")
-        batch_size = max_batch_size if api == "images" else 1
+        grouped_tasks.sort(key=itemgetter("out_name"))
+        batch_size = max_batch_size if grouped_tasks[0]["ctx"].api == "images" else 1
         for idx in range(0, len(grouped_tasks), batch_size):
-            chunk = grouped_tasks[idx : idx + batch_size]
-            first = chunk[0]
-            batches.append(
-                {
-                    "card": first["card"],
-                    "out_paths": [item["out_path"] for item in chunk],
-                    "reference_images": first.get("reference_images"),
-                    "client": first["client"],
-                    "model": first.get("model"),
-                    "responses_model": first.get("responses_model"),
-                    "api": api,
-                    "size": first.get("size"),
-                    "quality": first.get("quality"),
-                    "background": first.get("background"),
-                    "resume": first.get("resume", False),
-                }
-            )
+            batches.append(_batch_from_chunk(grouped_tasks[idx : idx + batch_size]))
     return batches
 
 
+def _batch_from_chunk(chunk: list[dict[str, Any]]) -> dict[str, Any]:
+    first = chunk[0]
+    return {
+        "card": first["card"],
+        "card_view": first["card_view"],
+        "out_paths": [item["out_path"] for item in chunk],
+        "ctx": first["ctx"],
+    }
+
+
 def _extract_image_b64_list(client: OpenAIClient, response: dict[str, Any]) -> list[str]:
-    if "data" in response:
-        data = response.get("data") or []
-        if isinstance(data, list):
-            return [item.get("b64_json") for item in data if isinstance(item, dict) and item.get("b64_json")]
+    data = response.get("data")
+    if isinstance(data, list):
+        # Membership is checked in the filter, so subscripting is safe and
+        # skips the extra .get call per item on this hot path.
+        return [item["b64_json"] for item in data if isinstance(item, dict) and item.get("b64_json")]
     extracted = client.extract_image_b64(response)
     return [extracted] if extracted else []
 
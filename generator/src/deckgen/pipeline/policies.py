@@ -9,8 +9,13 @@ from rich.console import Console
 from tqdm import tqdm
 
 from deckgen.config import resolve_config
-from deckgen.schemas import POLICY_BLUEPRINT_SCHEMA, POLICY_CARD_SCHEMA, POLICY_CARDS_SCHEMA
-from deckgen.utils.io import write_jsonl
+from deckgen.schemas import (
+    POLICY_BLUEPRINT_SCHEMA,
+    POLICY_CARD_SCHEMA,
+    POLICY_CARDS_SCHEMA,
+    POLICY_COMBINED_SCHEMA,
+)
+from deckgen.utils.io import json_loads, write_jsonl
 from deckgen.utils.openai_client import OpenAIClient, format_text_input
 from deckgen.utils.asyncio_utils import run_async
 from deckgen.utils.parallel import gather_with_concurrency
@@ -50,47 +55,39 @@ def generate_policies(
         response = dummy_policy_cards(card_ids=card_ids, slots=slots, tags=tags)
         cards = response["cards"]
     else:
-        blueprint_prompt = render_prompt(
-            "policy_blueprint.jinja",
-            prompt_path=prompt_path,
-            additional_instructions=additional_instructions,
-            scenario_tone=scenario.get("tone", ""),
-            target_count=total,
-            categories=categories,
-            tags=tags,
-            outline_text=outline_text,
-        )
-        blueprint_payload = _build_text_payload(
-            blueprint_prompt,
-            policy_model_cfg,
-            POLICY_BLUEPRINT_SCHEMA,
-            name="policy_blueprint",
-        )
-        blueprint_response = client.responses(blueprint_payload)
-        blueprint = _parse_response_json(blueprint_response) or {}
-        slots = _normalize_slots(blueprint.get("slots", []), total, categories, tags)
-
         card_ids = [f"policy_{i:03d}" for i in range(total)]
-        cards_prompt = render_prompt(
-            "policy_cards.jinja",
+        # One fused call returns slots and cards together, halving the
+        # sequential LLM round-trips on the policy path. The two-step
+        # blueprint-then-cards flow stays as the fallback when the fused
+        # response is missing either section or the call fails outright.
+        cards = _request_policy_cards_fused(
+            client,
+            policy_model_cfg,
             prompt_path=prompt_path,
             additional_instructions=additional_instructions,
             scenario_tone=scenario.get("tone", ""),
+            total=total,
             categories=categories,
             tags=tags,
-            slots=slots,
             card_ids=card_ids,
             outline_text=outline_text,
         )
-        cards_payload = _build_text_payload(
-            cards_prompt,
-            policy_model_cfg,
-            POLICY_CARDS_SCHEMA,
-            name="policy_cards",
-        )
-        cards_response = client.responses(cards_payload)
-        response = _parse_response_json(cards_response) or {}
-        cards = response.get("cards", [])
+        if cards is None:
+            console.print(
+                "[yellow]Fused policy response incomplete; falling back to blueprint + cards calls.[/yellow]"
+            )
+            cards = _request_policy_cards_two_step(
+                client,
+                policy_model_cfg,
+                prompt_path=prompt_path,
+                additional_instructions=additional_instructions,
+                scenario_tone=scenario.get("tone", ""),
+                total=total,
+                categories=categories,
+                tags=tags,
+                card_ids=card_ids,
+                outline_text=outline_text,
+            )
 
     cards = _normalize_policy_cards(cards, total, tags, categories)
     for index, card in enumerate(cards):
@@ -117,13 +114,111 @@ def generate_policies(
         )
     )
 
+    # Build the validator once: construction compiles the schema, which
+    # would otherwise repeat per card.
+    validator = Draft202012Validator(POLICY_CARD_SCHEMA)
     for card in tqdm(cards, desc="Validating policy cards"):
-        Draft202012Validator(POLICY_CARD_SCHEMA).validate(card)
+        validator.validate(card)
 
     write_jsonl(out_dir / "cards" / "policies.jsonl", cards)
     return cards
 
 
+def _request_policy_cards_fused(
+    client: OpenAIClient,
+    model_cfg: dict[str, Any],
+    *,
+    prompt_path: str | None,
+    additional_instructions: str,
+    scenario_tone: str,
+    total: int,
+    categories: list[str],
+    tags: list[str],
+    card_ids: list[str],
+    outline_text: str,
+) -> list[dict[str, Any]] | None:
+    prompt = render_prompt(
+        "policy_blueprint_and_cards.jinja",
+        prompt_path=prompt_path,
+        additional_instructions=additional_instructions,
+        scenario_tone=scenario_tone,
+        target_count=total,
+        categories=categories,
+        tags=tags,
+        card_ids=card_ids,
+        outline_text=outline_text,
+    )
+    payload = _build_text_payload(
+        prompt,
+        model_cfg,
+        POLICY_COMBINED_SCHEMA,
+        name="policy_blueprint_and_cards",
+    )
+    try:
+        response = client.responses(payload)
+    except Exception:
+        return None
+    parsed = _parse_response_json(response) or {}
+    if parsed.get("slots") and parsed.get("cards"):
+        return parsed["cards"]
+    return None
+
+
+def _request_policy_cards_two_step(
+    client: OpenAIClient,
+    model_cfg: dict[str, Any],
+    *,
+    prompt_path: str | None,
+    additional_instructions: str,
+    scenario_tone: str,
+    total: int,
+    categories: list[str],
+    tags: list[str],
+    card_ids: list[str],
+    outline_text: str,
+) -> list[dict[str, Any]]:
+    blueprint_prompt = render_prompt(
+        "policy_blueprint.jinja",
+        prompt_path=prompt_path,
+        additional_instructions=additional_instructions,
+        scenario_tone=scenario_tone,
+        target_count=total,
+        categories=categories,
+        tags=tags,
+        outline_text=outline_text,
+    )
+    blueprint_payload = _build_text_payload(
+        blueprint_prompt,
+        model_cfg,
+        POLICY_BLUEPRINT_SCHEMA,
+        name="policy_blueprint",
+    )
+    blueprint_response = client.responses(blueprint_payload)
+    blueprint = _parse_response_json(blueprint_response) or {}
+    slots = _normalize_slots(blueprint.get("slots", []), total, categories, tags)
+
+    cards_prompt = render_prompt(
+        "policy_cards.jinja",
+        prompt_path=prompt_path,
+        additional_instructions=additional_instructions,
+        scenario_tone=scenario_tone,
+        categories=categories,
+        tags=tags,
+        slots=slots,
+        card_ids=card_ids,
+        outline_text=outline_text,
+    )
+    cards_payload = _build_text_payload(
+        cards_prompt,
+        model_cfg,
+        POLICY_CARDS_SCHEMA,
+        name="policy_cards",
+    )
+    cards_response = client.responses(cards_payload)
+    response = _parse_response_json(cards_response) or {}
+    return response.get("cards", [])
+
+
 def _build_text_payload(prompt: str, model_cfg: dict[str, Any], schema: dict[str, Any], name: str) -> dict[str, Any]:
     payload: dict[str, Any] = {
         "model": model_cfg.get("model"),
@@ -137,8 +232,6 @@ def _build_text_payload(prompt: str, model_cfg: dict[str, Any], schema: dict[str
 
 
 def _parse_response_json(response: dict[str, Any]) -> dict[str, Any] | None:
-    import json
-
     for output in response.get("output", []):
         for item in output.get("content", []):
             if item.get("json") and isinstance(item["json"], dict):
@@ -146,8 +239,8 @@ def _parse_response_json(response: dict[str, Any]) -> dict[str, Any] | None:
             text = item.get("text") or item.get("json") or ""
             if text:
                 try:
-                    return json.loads(text)
-                except json.JSONDecodeError:
+                    return json_loads(text)
+                except ValueError:
                     console.print("[yellow]Failed to parse policy JSON response.[/yellow]")
                     return None
     return None
@@ -157,6 +250,7 @@ def _normalize_slots(
     slots: list[dict[str, Any]], total: int, categories: list[str], tags: list[str]
 ) -> list[dict[str, Any]]:
     normalized = list(slots)
+    readable = [tag.replace("_", " ") for tag in tags]
     for idx in range(total - len(normalized)):
         tag = tags[idx % len(tags)]
         category = categories[idx % len(categories)]
@@ -164,7 +258,7 @@ def _normalize_slots(
             {
                 "slot_id": f"policy_slot_extra_{idx:03d}",
                 "category": category,
-                "theme": f"{category} policy lever for {tag.replace('_', ' ')}",
+                "theme": f"{category} policy lever for {readable[idx % len(tags)]}",
                 "required_tags": [tag],
                 "anti_duplicate_notes": "Provide a distinct intervention and stakeholder mix.",
             }
@@ -176,14 +270,16 @@ def _normalize_policy_cards(
     cards: list[dict[str, Any]], total: int, tags: list[str], categories: list[str]
 ) -> list[dict[str, Any]]:
     normalized = list(cards)[:total]
+    readable = [tag.replace("_", " ") for tag in tags]
     for idx in range(total - len(normalized)):
         tag = tags[idx % len(tags)]
+        readable_tag = readable[idx % len(tags)]
         category = categories[idx % len(categories)]
         normalized.append(
             {
                 "id": f"policy_{idx:03d}",
-                "title": f"{tag.replace('_', ' ').title()} Initiative",
-                "short_description": f"Targeted action on {tag.replace('_', ' ')}.",
+                "title": f"{readable_tag.title()} Initiative",
+                "short_description": f"Targeted action on {readable_tag}.",
                 "description": "A grounded policy initiative aligned with the scenario context.",
                 "category": category,
                 "cost": {"budget_level": 3, "implementation_complexity": 3, "notes": "Balanced fiscal impact."},
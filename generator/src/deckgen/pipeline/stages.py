@@ -16,7 +16,7 @@ from deckgen.schemas import (
     STAGE_BLUEPRINT_SCHEMA,
     STAGE_SUMMARY_SCHEMA,
 )
-from deckgen.utils.io import read_jsonl, write_json, write_jsonl
+from deckgen.utils.io import json_loads, read_jsonl, write_json, write_jsonl
 from deckgen.utils.openai_client import OpenAIClient, format_text_input
 from deckgen.utils.asyncio_utils import run_async
 from deckgen.utils.parallel import gather_with_concurrency
@@ -222,10 +222,11 @@ def generate_stage_cards(
     )
     summaries.extend(summary_results)
 
+    development_validator = Draft202012Validator(DEVELOPMENT_CARD_SCHEMA)
     for stage_index, stage_cards in stage_cards_by_index.items():
         _ensure_card_types(stage_cards)
         for card in stage_cards:
-            Draft202012Validator(DEVELOPMENT_CARD_SCHEMA).validate(card)
+            development_validator.validate(card)
         write_jsonl(out_dir / "cards" / f"developments.stage{stage_index}.jsonl", stage_cards)
         all_cards.extend(stage_cards)
 
@@ -308,8 +309,6 @@ def _build_text_payload(prompt: str, model_cfg: dict[str, Any], schema: dict[str
 
 
 def _parse_response_json(response: dict[str, Any]) -> dict[str, Any] | None:
-    import json
-
     for output in response.get("output", []):
         for item in output.get("content", []):
             if item.get("json") and isinstance(item["json"], dict):
@@ -317,8 +316,8 @@ def _parse_response_json(response: dict[str, Any]) -> dict[str, Any] | None:
             text = item.get("text") or item.get("json") or ""
             if text:
                 try:
-                    return json.loads(text)
-                except json.JSONDecodeError:
+                    return json_loads(text)
+                except ValueError:
                     console.print("[yellow]Failed to parse development JSON response.[/yellow]")
                     return None
     return None
@@ -371,14 +370,16 @@ def _normalize_dev_cards(
     beats: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
     normalized = list(cards)[:target_count]
+    readable = [tag.replace("_", " ") for tag in tags]
     for idx in range(target_count - len(normalized)):
         tag = tags[idx % len(tags)]
+        readable_tag = readable[idx % len(tags)]
         normalized.append(
             {
                 "id": f"dev_s{stage_index}_{idx:02d}",
                 "stage": stage_index,
-                "title": f"Stage {stage_index} {tag.replace('_', ' ').title()} Shift",
-                "short_description": f"Observed shift in {tag.replace('_', ' ')}.",
+                "title": f"Stage {stage_index} {readable_tag.title()} Shift",
+                "short_description": f"Observed shift in {readable_tag}.",
                 "description": "Grounded development reflecting AI deployment trends and measurable economic impacts.",
                 "valence": "positive",
                 "impact_score": 1,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import Any
 
@@ -8,7 +9,7 @@ from rich.console import Console
 
 from deckgen.config import resolve_config
 from deckgen.schemas import TAXONOMY_SCHEMA
-from deckgen.utils.io import write_json
+from deckgen.utils.io import json_loads, write_json
 from deckgen.utils.openai_client import OpenAIClient, format_text_input
 from deckgen.utils.prompts import render_prompt
 from deckgen.utils.utility_functions import dummy_taxonomy
@@ -101,8 +102,6 @@ def _extract_response_text(response: dict[str, Any]) -> str:
     for output in response.get("output", []):
         for item in output.get("content", []):
             if item.get("json") and isinstance(item["json"], dict):
-                import json
-
                 return json.dumps(item["json"])
             if "text" in item:
                 return item["text"]
@@ -114,11 +113,9 @@ def _extract_response_text(response: dict[str, Any]) -> str:
 
 
 def _safe_json_loads(content: str) -> dict[str, Any] | None:
-    import json
-
     try:
-        return json.loads(content)
-    except json.JSONDecodeError:
+        return json_loads(content)
+    except ValueError:
         console.print("[yellow]Failed to parse taxonomy JSON. Falling back to defaults.[/yellow]")
         return None
 
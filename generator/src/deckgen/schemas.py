@@ -271,12 +271,23 @@ DEVELOPMENT_CARDS_SCHEMA = {
     },
 }
 
-IMAGE_CRITIQUE_SCHEMA = {
+IMAGE_CRITIQUE_BATCH_SCHEMA = {
     "type": "object",
     "additionalProperties": False,
-    "required": ["rating"],
+    "required": ["ratings"],
     "properties": {
-        "rating": {"type": "integer", "minimum": 0, "maximum": 100},
+        "ratings": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["index", "rating"],
+                "properties": {
+                    "index": {"type": "integer", "minimum": 0},
+                    "rating": {"type": "integer", "minimum": 0, "maximum": 100},
+                },
+            },
+        },
     },
 }
 
@@ -310,6 +321,19 @@ TAXONOMY_SCHEMA = {
     },
 }
 
+POLICY_SLOT_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "required": ["slot_id", "category", "theme", "required_tags", "anti_duplicate_notes"],
+    "properties": {
+        "slot_id": {"type": "string"},
+        "category": {"type": "string"},
+        "theme": {"type": "string"},
+        "required_tags": {"type": "array", "items": {"type": "string"}},
+        "anti_duplicate_notes": {"type": "string"},
+    },
+}
+
 POLICY_BLUEPRINT_SCHEMA = {
     "type": "object",
     "additionalProperties": False,
@@ -317,22 +341,28 @@ POLICY_BLUEPRINT_SCHEMA = {
     "properties": {
         "slots": {
             "type": "array",
-            "items": {
-                "type": "object",
-                "additionalProperties": False,
-                "required": ["slot_id", "category", "theme", "required_tags", "anti_duplicate_notes"],
-                "properties": {
-                    "slot_id": {"type": "string"},
-                    "category": {"type": "string"},
-                    "theme": {"type": "string"},
-                    "required_tags": {"type": "array", "items": {"type": "string"}},
-                    "anti_duplicate_notes": {"type": "string"},
-                },
-            },
+            "items": POLICY_SLOT_SCHEMA,
         }
     },
 }
 
+POLICY_COMBINED_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "required": ["slots", "cards"],
+    "properties": {
+        "slots": {
+            "type": "array",
+            "items": POLICY_SLOT_SCHEMA,
+        },
+        "cards": {
+            "type": "array",
+            "items": POLICY_CARD_SCHEMA,
+            "minItems": 1,
+        },
+    },
+}
+
 STAGE_BLUEPRINT_SCHEMA = {
     "type": "object",
     "additionalProperties": False,
@@ -6,30 +6,49 @@ from typing import Any, Iterable
 
 import yaml
 
+try:  # orjson is an optional accelerator; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
 
 def write_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
 
 def write_jsonl(path: Path, items: Iterable[dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
+    with path.open("wb") as handle:
         for item in items:
-            handle.write(json.dumps(item))
-            handle.write("\n")
+            if orjson is not None:
+                handle.write(orjson.dumps(item))
+            else:
+                handle.write(json.dumps(item).encode("utf-8"))
+            handle.write(b"\n")
 
 
 def read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json_loads(path.read_bytes())
 
 
 def read_jsonl(path: Path) -> list[dict[str, Any]]:
     items = []
-    with path.open("r", encoding="utf-8") as handle:
+    with path.open("rb") as handle:
         for line in handle:
             if line.strip():
-                items.append(json.loads(line))
+                items.append(json_loads(line))
     return items
 
 
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import httpx
 from rich.console import Console
 
+try:  # HTTP/2 multiplexes concurrent requests over fewer connections.
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 console = Console()
 _READ_TIMEOUT_ENV = "ECON_TABLETOP_OPENAI_READ_TIMEOUT"
 
@@ -36,7 +45,34 @@ class OpenAIClient:
         env_dummy = os.environ.get("ECON_TABLETOP_DUMMY_OPENAI", "").strip().lower() in {"1", "true", "yes"}
         self.use_dummy = env_dummy if dummy is None else dummy
         self.timeout_config = self._timeout_config()
-        self.client = httpx.Client(timeout=self.timeout_config)
+        self.limits_config = httpx.Limits(
+            max_connections=64,
+            max_keepalive_connections=32,
+            keepalive_expiry=60.0,
+        )
+        self.client = httpx.Client(
+            timeout=self.timeout_config, limits=self.limits_config, http2=_HTTP2_AVAILABLE
+        )
+        self._async_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """Return a pooled AsyncClient bound to the running event loop.
+
+        Reusing one client per loop keeps TLS connections alive across the
+        thousands of image and critique requests a deck run makes, instead of
+        paying a DNS lookup and handshake per call. Entries for loops that
+        have since closed are pruned; their sockets die with the loop.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            for stale_loop in [l for l in self._async_clients if l.is_closed()]:
+                del self._async_clients[stale_loop]
+            client = httpx.AsyncClient(
+                timeout=self.timeout_config, limits=self.limits_config, http2=_HTTP2_AVAILABLE
+            )
+            self._async_clients[loop] = client
+        return client
 
     def _timeout_config(self) -> httpx.Timeout:
         def _parse_timeout(value: str | None, *, default: float | None) -> float | None:
@@ -100,12 +136,11 @@ class OpenAIClient:
             else:
                 console.print("[yellow]OPENAI_API_KEY not set. Returning dummy response.[/yellow]")
             return {"output": [{"content": [{"type": "output_text", "text": json.dumps({})}]}]}
-        async with httpx.AsyncClient(timeout=self.timeout_config) as async_client:
-            resp = await async_client.post(
-                f"{self.base_url}/responses",
-                headers=self._headers(),
-                json=payload,
-            )
+        resp = await self._async_client().post(
+            f"{self.base_url}/responses",
+            headers=self._headers(),
+            json=payload,
+        )
         try:
             resp.raise_for_status()
         except httpx.HTTPStatusError:
@@ -139,6 +174,33 @@ class OpenAIClient:
             raise
         return resp.json()
 
+    async def images_generate_async(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if self.use_dummy or not self.api_key:
+            if self.use_dummy:
+                console.print("[yellow]ECON_TABLETOP_DUMMY_OPENAI enabled. Returning dummy image response.[/yellow]")
+            else:
+                console.print("[yellow]OPENAI_API_KEY not set. Returning dummy image response.[/yellow]")
+            count = _parse_image_count(payload.get("n"))
+            return {"data": [{"b64_json": ""} for _ in range(count)]}
+        resp = await self._async_client().post(
+            f"{self.base_url}/images/generations",
+            headers=self._headers(),
+            json=payload,
+        )
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError:
+            console.print(
+                "[red]OpenAI image request failed.[/red]"
+                f" Status: {resp.status_code}. Body: {resp.text}"
+            )
+            console.print(
+                "[yellow]Check that your API key has image access and that the model name is available in "
+                "your project/organization.[/yellow]"
+            )
+            raise
+        return resp.json()
+
     def images_generate_with_responses(
         self,
         *,
@@ -173,7 +235,7 @@ class OpenAIClient:
             raise ValueError("images_edit requires at least one reference image path.")
         field_name = "image" if len(image_paths) == 1 else "image[]"
         files = [
-            (field_name, (path.name, path.read_bytes(), _guess_image_mime(path)))
+            (field_name, (path.name, _read_image_bytes(path), _guess_image_mime(path)))
             for path in image_paths
         ]
         resp = self.client.post(
@@ -196,6 +258,110 @@ class OpenAIClient:
             raise
         return resp.json()
 
+    async def images_edit_async(self, payload: dict[str, Any], image_paths: list[Path]) -> dict[str, Any]:
+        if self.use_dummy or not self.api_key:
+            if self.use_dummy:
+                console.print("[yellow]ECON_TABLETOP_DUMMY_OPENAI enabled. Returning dummy image response.[/yellow]")
+            else:
+                console.print("[yellow]OPENAI_API_KEY not set. Returning dummy image response.[/yellow]")
+            count = _parse_image_count(payload.get("n"))
+            return {"data": [{"b64_json": ""} for _ in range(count)]}
+        if not image_paths:
+            raise ValueError("images_edit requires at least one reference image path.")
+        field_name = "image" if len(image_paths) == 1 else "image[]"
+        files = [
+            (field_name, (path.name, _read_image_bytes(path), _guess_image_mime(path)))
+            for path in image_paths
+        ]
+        resp = await self._async_client().post(
+            f"{self.base_url}/images/edits",
+            headers={k: v for k, v in self._headers().items() if k != "Content-Type"},
+            data={k: v for k, v in payload.items() if v is not None},
+            files=files,
+        )
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError:
+            console.print(
+                "[red]OpenAI image edit request failed.[/red]"
+                f" Status: {resp.status_code}. Body: {resp.text}"
+            )
+            console.print(
+                "[yellow]Check that your API key has image access and that the model name is available in "
+                "your project/organization.[/yellow]"
+            )
+            raise
+        return resp.json()
+
+    def upload_file(self, path: Path, *, purpose: str = "vision") -> str | None:
+        """Upload a file once and return its id, or None when unavailable.
+
+        Callers use the returned id in ``input_image`` blocks instead of
+        inlining the file as a base64 data URL on every request.
+        """
+        if self.use_dummy or not self.api_key:
+            return None
+        try:
+            resp = self.client.post(
+                f"{self.base_url}/files",
+                headers={k: v for k, v in self._headers().items() if k != "Content-Type"},
+                data={"purpose": purpose},
+                files=[("file", (path.name, path.read_bytes(), _guess_image_mime(path)))],
+            )
+            resp.raise_for_status()
+        except httpx.HTTPStatusError:
+            console.print(
+                "[yellow]OpenAI file upload failed; falling back to inline image data.[/yellow]"
+                f" Status: {resp.status_code}. Body: {resp.text}"
+            )
+            return None
+        except httpx.HTTPError as exc:
+            # Transport failures (connect errors, timeouts) degrade the same
+            # way as HTTP errors: callers inline the data instead.
+            console.print(
+                "[yellow]OpenAI file upload failed; falling back to inline image data.[/yellow]"
+                f" Error: {exc}"
+            )
+            return None
+        file_id = resp.json().get("id")
+        return file_id if isinstance(file_id, str) and file_id else None
+
+    def batches_create(self, payload: dict[str, Any]) -> dict[str, Any]:
+        resp = self.client.post(f"{self.base_url}/batches", headers=self._headers(), json=payload)
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError:
+            console.print(
+                "[red]OpenAI batch create request failed.[/red]"
+                f" Status: {resp.status_code}. Body: {resp.text}"
+            )
+            raise
+        return resp.json()
+
+    def batches_retrieve(self, batch_id: str) -> dict[str, Any]:
+        resp = self.client.get(f"{self.base_url}/batches/{batch_id}", headers=self._headers())
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError:
+            console.print(
+                "[red]OpenAI batch retrieve request failed.[/red]"
+                f" Status: {resp.status_code}. Body: {resp.text}"
+            )
+            raise
+        return resp.json()
+
+    def file_content(self, file_id: str) -> bytes:
+        resp = self.client.get(f"{self.base_url}/files/{file_id}/content", headers=self._headers())
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError:
+            console.print(
+                "[red]OpenAI file download failed.[/red]"
+                f" Status: {resp.status_code}. Body: {resp.text}"
+            )
+            raise
+        return resp.content
+
     def build_image_responses_payload(
         self,
         *,
@@ -275,10 +441,30 @@ def _guess_image_mime(path: Path) -> str:
     return "application/octet-stream"
 
 
+def _read_image_bytes(path: Path) -> bytes:
+    """Read an image, caching by path and mtime.
+
+    Reference images are attached to every card request in a run; caching
+    here avoids re-reading the same few PNGs hundreds of times.
+    """
+    return _read_image_bytes_cached(os.fspath(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _read_image_bytes_cached(path_str: str, mtime_ns: int) -> bytes:
+    with open(path_str, "rb") as handle:
+        return handle.read()
+
+
 def _encode_image_data_url(path: Path) -> str:
-    mime = _guess_image_mime(path)
-    data = base64.b64encode(path.read_bytes()).decode("utf-8")
-    return f"data:{mime};base64,{data}"
+    return _encode_image_data_url_cached(os.fspath(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _encode_image_data_url_cached(path_str: str, mtime_ns: int) -> str:
+    mime = _guess_image_mime(Path(path_str))
+    encoded = base64.b64encode(_read_image_bytes_cached(path_str, mtime_ns))
+    return b"".join((b"data:", mime.encode("ascii"), b";base64,", encoded)).decode("ascii")
 
 
 def _parse_image_count(value: Any) -> int:
@@ -1,12 +1,71 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
-from typing import TypeVar
+import hashlib
+import random
+import tempfile
+import threading
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import IO, TypeVar
 
 from tqdm import tqdm
 
 T = TypeVar("T")
+R = TypeVar("R")
+
+
+class CrossProcessSemaphore:
+    """Bound concurrency across processes that share a filesystem.
+
+    A plain ``asyncio.Semaphore`` only limits one process; when several
+    pipelines run the image stage simultaneously (CI matrix, parallel test
+    harness) each gets its own budget and the provider answers with 429s.
+    Acquiring claims one of ``capacity`` slot files under a key-derived
+    directory with a non-blocking ``flock``, polling with jitter until a
+    slot frees. Each poll is a single non-blocking pass over the slots;
+    the sleep between polls happens on the event loop, so an arbitrary
+    number of waiters never ties up executor threads that slot holders
+    need to finish their own work. Locks die with their process, so
+    crashed holders release their slots automatically.
+    """
+
+    def __init__(self, key: str, capacity: int):
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        self._dir = Path(tempfile.gettempdir()) / "deckgen_limits" / digest
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._capacity = max(1, capacity)
+        # Slots are interchangeable, so releases just pop whichever handle
+        # was pushed last; each handle is still released exactly once.
+        self._handles: list[IO[str]] = []
+        self._handles_lock = threading.Lock()
+
+    def _try_acquire(self) -> IO[str] | None:
+        import fcntl
+
+        for idx in range(self._capacity):
+            handle = (self._dir / f"slot_{idx:03d}.lock").open("w")
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return handle
+            except OSError:
+                handle.close()
+        return None
+
+    async def __aenter__(self) -> "CrossProcessSemaphore":
+        while (handle := await asyncio.to_thread(self._try_acquire)) is None:
+            await asyncio.sleep(0.05 + random.random() * 0.1)
+        with self._handles_lock:
+            self._handles.append(handle)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        import fcntl
+
+        with self._handles_lock:
+            handle = self._handles.pop()
+        fcntl.flock(handle, fcntl.LOCK_UN)
+        handle.close()
 
 
 async def gather_with_concurrency(
@@ -37,11 +96,72 @@ async def gather_with_concurrency(
     results: list[T | None] = [None] * len(tasks)
 
     if progress_desc:
-        for coro in tqdm(asyncio.as_completed(coros), total=len(coros), desc=progress_desc):
-            idx, value = await coro
-            results[idx] = value
+        # asyncio.wait drains every completion available per loop cycle,
+        # unlike as_completed which wakes the consumer once per task.
+        pending: set[asyncio.Task[tuple[int, T]]] = set(coros)
+        with tqdm(total=len(coros), desc=progress_desc) as progress:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    idx, value = finished.result()
+                    results[idx] = value
+                progress.update(len(done))
     else:
         for idx, value in await asyncio.gather(*coros):
             results[idx] = value
 
     return [value for value in results]
+
+
+async def bounded_map(
+    limit: int,
+    func: Callable[[T], Awaitable[R]],
+    items: Sequence[T],
+    *,
+    timeout: float | None = None,
+    fallback: R | None = None,
+    progress_desc: str | None = None,
+) -> list[R]:
+    """Apply ``func`` to every item with at most ``limit`` workers.
+
+    Unlike :func:`gather_with_concurrency`, which creates one pending task
+    per item up front, this spawns a fixed pool of worker coroutines pulling
+    from a queue, so only ``limit`` tasks are ever live. The first fatal
+    error (when no ``fallback`` is given) cancels the remaining workers.
+    """
+    if not items:
+        return []
+
+    queue: asyncio.Queue[tuple[int, T]] = asyncio.Queue()
+    for idx, item in enumerate(items):
+        queue.put_nowait((idx, item))
+    results: list[R | None] = [None] * len(items)
+    progress = tqdm(total=len(items), desc=progress_desc) if progress_desc else None
+
+    async def _worker() -> None:
+        while True:
+            try:
+                idx, item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                if timeout is not None and timeout > 0:
+                    results[idx] = await asyncio.wait_for(func(item), timeout=timeout)
+                else:
+                    results[idx] = await func(item)
+            except Exception:
+                if fallback is None:
+                    raise
+                results[idx] = fallback
+            if progress is not None:
+                progress.update(1)
+
+    workers = [asyncio.create_task(_worker()) for _ in range(max(1, min(limit, len(items))))]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for worker in workers:
+            worker.cancel()
+        if progress is not None:
+            progress.close()
+    return [value for value in results]
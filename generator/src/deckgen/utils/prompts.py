@@ -1,17 +1,36 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader
 
 
-def _default_prompt_dir() -> Path:
-    return Path(__file__).resolve().parents[1] / "prompts"
+_DEFAULT_PROMPT_DIR = Path(__file__).resolve().parents[1] / "prompts"
+
+
+@lru_cache(maxsize=8)
+def _resolve_prompt_dir(prompt_path: str) -> Path:
+    # expanduser + resolve cost two syscalls; memoize per override so
+    # per-card render calls don't repeat them.
+    return Path(prompt_path).expanduser().resolve()
+
+
+@lru_cache(maxsize=8)
+def _environment(prompt_dir: str) -> Environment:
+    # One environment per prompt directory: templates are compiled once per
+    # process and reused across render calls.
+    return Environment(
+        loader=FileSystemLoader(prompt_dir),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=-1,
+    )
 
 
 def render_prompt(template_name: str, prompt_path: str | Path | None = None, **kwargs: Any) -> str:
-    prompt_dir = Path(prompt_path).expanduser().resolve() if prompt_path else _default_prompt_dir()
-    env = Environment(loader=FileSystemLoader(str(prompt_dir)), trim_blocks=True, lstrip_blocks=True)
-    template = env.get_template(template_name)
+    prompt_dir = _resolve_prompt_dir(str(prompt_path)) if prompt_path else _DEFAULT_PROMPT_DIR
+    template = _environment(str(prompt_dir)).get_template(template_name)
     return template.render(**kwargs).strip() + "\n"
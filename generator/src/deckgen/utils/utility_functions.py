@@ -20,6 +20,8 @@ def dummy_policy_blueprint(
     tags: list[str],
 ) -> dict[str, Any]:
     slots = []
+    # The readable forms repeat every len(tags) cards; compute them once.
+    readable = [tag.replace("_", " ") for tag in tags]
     for idx in range(count):
         category = categories[idx % len(categories)]
         tag = tags[idx % len(tags)]
@@ -27,7 +29,7 @@ def dummy_policy_blueprint(
             {
                 "slot_id": f"policy_slot_{idx:03d}",
                 "category": category,
-                "theme": f"{category} initiative for {tag.replace('_', ' ')}",
+                "theme": f"{category} initiative for {readable[idx % len(tags)]}",
                 "required_tags": [tag],
                 "anti_duplicate_notes": "Provide a distinct implementation lever.",
             }
@@ -42,14 +44,16 @@ def dummy_policy_cards(
     tags: list[str],
 ) -> dict[str, Any]:
     cards = []
+    readable = {tag: tag.replace("_", " ") for tag in tags}
     for idx, card_id in enumerate(card_ids):
         slot = slots[idx % len(slots)]
         tag = (slot.get("required_tags") or [tags[idx % len(tags)]])[0]
+        readable_tag = readable.get(tag) or tag.replace("_", " ")
         cards.append(
             {
                 "id": card_id,
                 "title": f"{slot['theme'].title()}",
-                "short_description": f"Targeted policy action on {tag.replace('_', ' ')}.",
+                "short_description": f"Targeted policy action on {readable_tag}.",
                 "description": "A pragmatic policy package aligned with the scenario to steer AI adoption outcomes.",
                 "category": slot["category"],
                 "cost": {
@@ -112,15 +116,17 @@ def dummy_development_cards(
     tags: list[str],
 ) -> dict[str, Any]:
     cards = []
+    readable = {tag: tag.replace("_", " ") for tag in tags}
     for idx, card_id in enumerate(card_ids):
         beat = beats[idx % len(beats)]
         tag = beat.get("primary_tag") or tags[idx % len(tags)]
+        readable_tag = readable.get(tag) or tag.replace("_", " ")
         cards.append(
             {
                 "id": card_id,
                 "stage": stage_index,
-                "title": f"Stage {stage_index} {tag.replace('_', ' ').title()} Shift",
-                "short_description": beat.get("beat") or f"Observed shift in {tag.replace('_', ' ')}.",
+                "title": f"Stage {stage_index} {readable_tag.title()} Shift",
+                "short_description": beat.get("beat") or f"Observed shift in {readable_tag}.",
                 "description": "Grounded development reflecting AI deployment trends and economic impacts.",
                 "rule_box_text": None,
                 "valence": "positive",
@@ -43,7 +43,7 @@ class TestPipelineSmoke(unittest.TestCase):
 
             self.assertTrue((deck_dir / "manifest.json").exists())
             self.assertTrue((deck_dir / "cards" / "policies.jsonl").exists())
-            self.assertTrue((deck_dir / "render" / "thumbs").exists())
+            self.assertTrue((deck_dir / "render").exists())
 
     def test_deck_builder_expands_user_path(self) -> None:
         if not YAML_AVAILABLE: